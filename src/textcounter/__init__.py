@@ -15,10 +15,14 @@ Example:
     2
 """
 
-from textcounter.analyzer import TextAnalyzer
-from textcounter.counter import TextCounter
+from typing import TYPE_CHECKING, Any
+
+from textcounter._version import __version__
+
+if TYPE_CHECKING:
+    from textcounter.analyzer import TextAnalyzer
+    from textcounter.counter import TextCounter
 
-__version__ = "1.0.0"
 __author__ = "Karim Galal"
 __email__ = "kg1606@gmail.com"
 
@@ -27,3 +31,20 @@ __all__ = [
     "TextAnalyzer",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the public classes on first access (PEP 562).
+
+    Keeps ``import textcounter`` and the CLI's ``--help``/``--version``
+    paths from loading the counting modules until they are needed.
+    """
+    if name == "TextCounter":
+        from textcounter.counter import TextCounter
+
+        return TextCounter
+    if name == "TextAnalyzer":
+        from textcounter.analyzer import TextAnalyzer
+
+        return TextAnalyzer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,48 +2,59 @@
 Advanced text analysis and NLP-lite tools.
 
 This module provides the TextAnalyzer class for comprehensive text analytics.
-All algorithms are implemented from scratch without relying on external
-libraries or heavy standard library abstractions like dataclasses.
+All algorithms are implemented without external libraries; hot counting
+loops are delegated to C-implemented standard library tools such as
+``collections.Counter``.
 
 Demonstrates: algorithm design, caching strategies, computational linguistics.
 """
 
 from __future__ import annotations
 
+import heapq
+import os
 import re
 import string
-from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, TypeVar
-
-from textcounter.counter import CountResult, TextCounter
-
-# Type variable for generic operations
-T = TypeVar("T")
-
-
-def memoize(func: Callable[..., T]) -> Callable[..., T]:
-    """Custom memoization decorator.
-
-    Hand-implemented caching decorator demonstrating decorator patterns
-    and closure-based state management. Uses weak references for methods.
-
-    This is a simplified version that caches based on instance + method name.
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from textcounter.counter import CountResult, TextCounter, _frequency_key
+
+
+def _rank_by_frequency(
+    frequencies: Dict[str, int], top_n: Optional[int] = None
+) -> List[Tuple[str, int]]:
+    """Rank items by frequency descending, then alphabetically.
+
+    Uses the built-in Timsort for a full ranking, and a bounded heap
+    (O(n log k)) when only the top ``top_n`` items are requested. A
+    negative ``top_n`` slices the full ranking, dropping that many items
+    from the end.
     """
-    cache: Dict[int, T] = {}
-
-    def wrapper(self: Any, *args: Any, **kwargs: Any) -> T:
-        # Create cache key from instance id and arguments
-        key = hash((id(self), args, tuple(sorted(kwargs.items()))))
+    if top_n is not None and top_n > 0:
+        return heapq.nsmallest(top_n, frequencies.items(), key=_frequency_key)
+    ranked = sorted(frequencies.items(), key=_frequency_key)
+    return ranked[:top_n] if top_n else ranked
 
-        if key not in cache:
-            cache[key] = func(self, *args, **kwargs)
 
-        return cache[key]
-
-    wrapper.__name__ = func.__name__
-    wrapper.__doc__ = func.__doc__
-    wrapper._cache = cache  # type: ignore
-
-    return wrapper
+@lru_cache(maxsize=128)
+def _compile_pattern(pattern: str, flags: int) -> re.Pattern[str]:
+    """Compile a user-supplied pattern, memoized per (pattern, flags)."""
+    return re.compile(pattern, flags)
 
 
 class FrequencyResult:
@@ -51,6 +62,9 @@ class FrequencyResult:
 
     Hand-implemented class with full Python protocol support.
     Provides dict-like access, iteration, and statistical methods.
+
+    Mapping properties return read-only views and ``most_common`` a tuple,
+    so reads never copy the underlying data.
     """
 
     __slots__ = ("_frequencies", "_total", "_unique", "_most_common", "_percentages")
@@ -66,18 +80,14 @@ class FrequencyResult:
         self._frequencies = frequencies
         self._total = total_items
         self._unique = unique_items
-        self._most_common = most_common
-
-        # Compute percentages
-        self._percentages: Dict[str, float] = {}
-        if total_items > 0:
-            for key, count in frequencies.items():
-                self._percentages[key] = round((count / total_items) * 100, 2)
+        self._most_common: Tuple[Tuple[str, int], ...] = tuple(most_common)
+        # Percentages are built on first access; most callers never read them
+        self._percentages: Optional[Dict[str, float]] = None
 
     @property
-    def frequencies(self) -> Dict[str, int]:
-        """Frequency mapping (copy for immutability)."""
-        return dict(self._frequencies)
+    def frequencies(self) -> Mapping[str, int]:
+        """Frequency mapping (read-only view)."""
+        return MappingProxyType(self._frequencies)
 
     @property
     def total_items(self) -> int:
@@ -90,14 +100,26 @@ class FrequencyResult:
         return self._unique
 
     @property
-    def most_common(self) -> List[Tuple[str, int]]:
-        """Most common items (copy)."""
-        return list(self._most_common)
+    def most_common(self) -> Tuple[Tuple[str, int], ...]:
+        """Most common items (immutable tuple)."""
+        return self._most_common
 
     @property
-    def percentages(self) -> Dict[str, float]:
-        """Percentage distribution."""
-        return dict(self._percentages)
+    def percentages(self) -> Mapping[str, float]:
+        """Percentage distribution (read-only view, computed on first access)."""
+        percentages = self._percentages
+        if percentages is None:
+            total = self._total
+            percentages = (
+                {
+                    key: round((count / total) * 100, 2)
+                    for key, count in self._frequencies.items()
+                }
+                if total > 0
+                else {}
+            )
+            self._percentages = percentages
+        return MappingProxyType(percentages)
 
     # Dict-like access
     def __getitem__(self, key: str) -> int:
@@ -126,7 +148,7 @@ class FrequencyResult:
 
     def top(self, n: int = 10) -> List[Tuple[str, int]]:
         """Get top N items."""
-        return self._most_common[:n]
+        return list(self._most_common[:n])
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
@@ -134,7 +156,7 @@ class FrequencyResult:
             "frequencies": self._frequencies,
             "total": self._total,
             "unique": self._unique,
-            "top_10": self._most_common[:10],
+            "top_10": list(self._most_common[:10]),
         }
 
 
@@ -356,6 +378,15 @@ class TextStatistics:
         }
 
 
+class _ComparisonStats(NamedTuple):
+    """The subset of statistics that ``TextAnalyzer.compare`` reports."""
+
+    word_count: int
+    char_count: int
+    avg_word_length: float
+    vocabulary_richness: float
+
+
 class TextAnalyzer:
     """Advanced text analysis engine.
 
@@ -366,128 +397,98 @@ class TextAnalyzer:
     deep understanding of computational linguistics.
     """
 
-    __slots__ = ("_text", "_counter", "_cache")
+    __slots__ = ("_counter", "_cache", "_cache_text")
 
     # Pre-compiled patterns for performance
     _EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
     _URL_PATTERN = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
     _NUMBER_PATTERN = re.compile(r"-?\d+\.?\d*")
+    _VOWEL_GROUP_PATTERN = re.compile(r"[aeiouy]+")
+    _SENTENCE_PATTERN = re.compile(r"[^.!?]*[.!?]+|[^.!?]+")
+
+    # Punctuation that commonly trails a URL in prose
+    _URL_TRAILING = ".,;:!?)"
 
     # Vowels for syllable counting
     VOWELS: frozenset = frozenset("aeiouyAEIOUY")
-
-    def __init__(self, text: str = "") -> None:
-        """Initialize analyzer."""
+    # Lowercase-only string form: for a six-letter alphabet a C-level
+    # substring scan beats hashing each character into a frozenset.
+    _VOWELS_LOWER: str = "aeiouy"
+
+    # Characters stripped from word boundaries during tokenization
+    _PUNCT: str = string.punctuation
+
+    def __init__(self, text: str = "", counter: Optional[TextCounter] = None) -> None:
+        """Initialize analyzer.
+
+        Args:
+            text: Text to analyze.
+            counter: Existing TextCounter over the same text, reused so its
+                cached tokens are shared. The counter owns the text: setting
+                ``text`` on the analyzer updates the counter, and any
+                analyzer sharing it sees the change.
+
+        Raises:
+            TypeError: If ``text`` is not a string.
+            ValueError: If ``counter`` holds different text.
+        """
         if not isinstance(text, str):
             raise TypeError(f"Expected str, got {type(text).__name__}")
-        self._text = text
-        self._counter = TextCounter(text)
-        self._cache: Dict[str, Any] = {}
+        if counter is None:
+            counter = TextCounter(text)
+        elif counter.text != text:
+            raise ValueError("counter must wrap the same text as the analyzer")
+        self._counter = counter
+        self._cache: Dict[Any, Any] = {}
+        self._cache_text = counter.text
 
     @property
     def text(self) -> str:
-        """Get analyzed text."""
-        return self._text
+        """Get analyzed text (held by the underlying counter)."""
+        return self._counter.text
 
     @text.setter
     def text(self, value: str) -> None:
-        """Set new text and clear caches."""
+        """Set new text on the underlying counter."""
         if not isinstance(value, str):
             raise TypeError(f"Expected str, got {type(value).__name__}")
-        self._text = value
         self._counter.text = value
-        self._cache.clear()
-
-    def _get_words(self, case_sensitive: bool = False) -> List[str]:
-        """Extract cleaned words from text.
-
-        Custom tokenization without external dependencies.
-        """
-        text = self._text if case_sensitive else self._text.lower()
-        words: List[str] = []
-        current: List[str] = []
-
-        for char in text:
-            if char.isspace():
-                if current:
-                    word = "".join(current)
-                    # Strip punctuation from boundaries
-                    word = self._strip_punctuation(word)
-                    if word:
-                        words.append(word)
-                    current = []
-            else:
-                current.append(char)
-
-        # Last word
-        if current:
-            word = "".join(current)
-            word = self._strip_punctuation(word)
-            if word:
-                words.append(word)
-
-        return words
-
-    @staticmethod
-    def _strip_punctuation(word: str) -> str:
-        """Strip punctuation from word boundaries."""
-        punctuation = set(string.punctuation)
-
-        start = 0
-        while start < len(word) and word[start] in punctuation:
-            start += 1
 
-        end = len(word) - 1
-        while end >= start and word[end] in punctuation:
-            end -= 1
+    def _results(self) -> Dict[Any, Any]:
+        """Return the result cache, emptied if the counter's text changed.
 
-        return word[start : end + 1]
-
-    def _sort_by_frequency(self, items: List[Tuple[str, int]]) -> List[Tuple[str, int]]:
-        """Sort items by frequency descending, then alphabetically.
-
-        Uses merge sort for stable O(n log n) performance.
-        Hand-implemented to demonstrate algorithm knowledge.
+        The text may be replaced through this analyzer, another analyzer
+        sharing the counter, or the counter itself, so the cache records
+        which text it was filled for rather than relying on the setter.
         """
-        if len(items) <= 1:
-            return items
-
-        mid = len(items) // 2
-        left = self._sort_by_frequency(items[:mid])
-        right = self._sort_by_frequency(items[mid:])
+        text = self._counter.text
+        if text is not self._cache_text:
+            self._cache.clear()
+            self._cache_text = text
+        return self._cache
 
-        return self._merge(left, right)
-
-    def _merge(
-        self, left: List[Tuple[str, int]], right: List[Tuple[str, int]]
-    ) -> List[Tuple[str, int]]:
-        """Merge two sorted lists.
+    def _get_words(self, case_sensitive: bool = False) -> List[str]:
+        """Extract cleaned words from text.
 
-        Comparison: higher frequency first, then alphabetical.
+        Splits on whitespace and strips boundary punctuation using the
+        C-level ``str.split``/``str.strip`` rather than a per-character loop.
+        The token list is cached per case mode until the text changes;
+        callers must treat it as read-only. Lowercase tokens are folded from
+        the cased ones, since lowercasing never creates or removes
+        whitespace or ASCII punctuation, so the text is tokenized only once.
         """
-        result: List[Tuple[str, int]] = []
-        i = j = 0
-
-        while i < len(left) and j < len(right):
-            # Compare by frequency (descending)
-            if left[i][1] > right[j][1]:
-                result.append(left[i])
-                i += 1
-            elif left[i][1] < right[j][1]:
-                result.append(right[j])
-                j += 1
+        cache_key = ("words", case_sensitive)
+        cache = self._results()
+        words: Optional[List[str]] = cache.get(cache_key)
+        if words is None:
+            if case_sensitive:
+                punct = self._PUNCT
+                tokens = (tok.strip(punct) for tok in self._counter.text.split())
+                words = [w for w in tokens if w]
             else:
-                # Equal frequency: sort alphabetically
-                if left[i][0] <= right[j][0]:
-                    result.append(left[i])
-                    i += 1
-                else:
-                    result.append(right[j])
-                    j += 1
-
-        result.extend(left[i:])
-        result.extend(right[j:])
-        return result
+                words = list(map(str.lower, self._get_words(True)))
+            cache[cache_key] = words
+        return words
 
     def char_frequency(
         self,
@@ -498,7 +499,7 @@ class TextAnalyzer:
     ) -> FrequencyResult:
         """Analyze character frequency.
 
-        Single-pass O(n) algorithm with custom sorting.
+        Single-pass O(n) counting; ranking uses the built-in sort.
         """
         result = self._counter.char_count(
             ignore_spaces=ignore_spaces,
@@ -506,11 +507,10 @@ class TextAnalyzer:
             case_sensitive=case_sensitive,
         )
 
-        frequencies = result.breakdown
-        items = list(frequencies.items())
-        sorted_items = self._sort_by_frequency(items)
-
-        most_common = sorted_items[:top_n] if top_n else sorted_items
+        # The CountResult never escapes this call, so adopt its dict rather
+        # than paying for the defensive copy made by ``.breakdown``.
+        frequencies = result._breakdown
+        most_common = _rank_by_frequency(frequencies, top_n)
 
         return FrequencyResult(
             frequencies=frequencies,
@@ -535,7 +535,10 @@ class TextAnalyzer:
             min_length=min_length,
         )
 
-        frequencies = dict(result.breakdown)
+        # The CountResult never escapes this call, so adopt its dict; only
+        # build another one when the exclusion filter needs to drop keys.
+        frequencies = result._breakdown
+        total = result.total
 
         # Apply exclusion filter
         if exclude_words:
@@ -545,13 +548,10 @@ class TextAnalyzer:
             frequencies = {
                 k: v for k, v in frequencies.items() if k not in exclude_normalized
             }
+            total = sum(frequencies.values())
 
         # Sort and limit
-        items = list(frequencies.items())
-        sorted_items = self._sort_by_frequency(items)
-        most_common = sorted_items[:top_n] if top_n else sorted_items
-
-        total = sum(frequencies.values())
+        most_common = _rank_by_frequency(frequencies, top_n)
 
         return FrequencyResult(
             frequencies=frequencies,
@@ -568,8 +568,13 @@ class TextAnalyzer:
     ) -> FrequencyResult:
         """Generate n-gram frequency analysis.
 
-        Custom sliding window implementation.
+        Sliding window built with ``zip`` over offset word sequences.
+
+        Raises:
+            ValueError: If ``n`` is less than 1.
         """
+        if n < 1:
+            raise ValueError(f"n must be at least 1, got {n}")
         words = self._get_words(case_sensitive)
 
         if len(words) < n:
@@ -580,21 +585,15 @@ class TextAnalyzer:
                 most_common=[],
             )
 
-        # Sliding window for n-gram generation
-        frequencies: Dict[str, int] = {}
-        total = 0
-
-        for i in range(len(words) - n + 1):
-            ngram = " ".join(words[i : i + n])
-            if ngram in frequencies:
-                frequencies[ngram] += 1
-            else:
-                frequencies[ngram] = 1
-            total += 1
+        # Sliding window for n-gram generation: zipping n staggered views
+        # of the word list yields each window as a tuple without slicing.
+        # Tuple keys hash over word references; each distinct n-gram is
+        # joined only once.
+        total = len(words) - n + 1
+        counts = Counter(zip(*(islice(words, i, None) for i in range(n))))
+        frequencies = {" ".join(gram): count for gram, count in counts.items()}
 
-        items = list(frequencies.items())
-        sorted_items = self._sort_by_frequency(items)
-        most_common = sorted_items[:top_n] if top_n else sorted_items
+        most_common = _rank_by_frequency(frequencies, top_n)
 
         return FrequencyResult(
             frequencies=frequencies,
@@ -604,6 +603,18 @@ class TextAnalyzer:
         )
 
     def _count_syllables(self, word: str) -> int:
+        """Estimate syllables in a word, caching the result.
+
+        Natural text repeats words heavily, and the estimate depends only
+        on the normalized word, so estimates are shared by every analyzer
+        in a bounded cache that survives text changes. Normalizing before
+        the lookup lets case variants share one entry.
+        """
+        return self._estimate_syllables(word.lower().strip())
+
+    @staticmethod
+    @lru_cache(maxsize=16384)
+    def _estimate_syllables(word: str) -> int:
         """Estimate syllables using vowel-counting heuristic.
 
         Custom implementation of syllable counting algorithm.
@@ -613,30 +624,22 @@ class TextAnalyzer:
         - '-le' endings after consonants
 
         This is a simplified version; perfect syllable counting
-        requires a pronunciation dictionary.
+        requires a pronunciation dictionary. Expects a lowercased,
+        stripped word (see ``_count_syllables``).
         """
-        word = word.lower().strip()
         if not word:
             return 0
 
-        count = 0
-        prev_is_vowel = False
-
-        for char in word:
-            is_vowel = char in self.VOWELS
-
-            # Count vowel groups (not individual vowels)
-            if is_vowel and not prev_is_vowel:
-                count += 1
-
-            prev_is_vowel = is_vowel
+        # Count vowel groups (not individual vowels) in one C-level scan
+        count = len(TextAnalyzer._VOWEL_GROUP_PATTERN.findall(word))
 
         # Handle silent 'e' at end (not part of -le)
         if word.endswith("e") and count > 1 and len(word) >= 2 and word[-2] not in "l":
             count -= 1
 
         # Handle '-le' endings (e.g., "table", "simple")
-        if len(word) >= 3 and word.endswith("le") and word[-3] not in self.VOWELS:
+        vowels = TextAnalyzer._VOWELS_LOWER
+        if len(word) >= 3 and word.endswith("le") and word[-3] not in vowels:
             count += 1
 
         # Handle common patterns that reduce syllables
@@ -662,16 +665,27 @@ class TextAnalyzer:
             50-59:  Fairly Difficult (10th-12th grade)
             30-49:  Difficult (College)
             0-29:   Very Difficult (Graduate)
+
+        The result is cached until the text changes.
         """
+        cache = self._results()
+        cache_key = "readability"
+        if cache_key not in cache:
+            cache[cache_key] = self._compute_readability()
+        result: ReadabilityResult = cache[cache_key]
+        return result
+
+    def _compute_readability(self) -> ReadabilityResult:
+        """Compute readability metrics."""
+        # One tokenization serves every metric: the word_count() breakdown
+        # already holds each distinct word with its frequency.
         words_result = self._counter.word_count()
-        sentences_result = self._counter.sentence_count()
+        sentences_result = self._counter.sentence_count(compute_breakdown=False)
 
         word_count = words_result.total
         sentence_count = max(1, sentences_result.total)
 
-        words = self._get_words()
-
-        if not words:
+        if word_count == 0:
             return ReadabilityResult(
                 flesch_reading_ease=0.0,
                 flesch_kincaid_grade=0.0,
@@ -681,17 +695,24 @@ class TextAnalyzer:
                 complexity_rating="N/A",
             )
 
-        # Calculate syllables
+        # Accumulate syllables and characters in one pass, visiting each
+        # distinct word once and weighting it by its frequency. Lengths are
+        # measured on the lowercased word, as the tokens were lowercased
+        # before this shared tokenization (some characters, like "İ", grow
+        # when lowercased). The syllable cache is fed the same normalized
+        # word _count_syllables would build, without lowercasing twice.
+        estimate_syllables = self._estimate_syllables
         total_syllables = 0
         total_chars = 0
-        for word in words:
-            total_syllables += self._count_syllables(word)
-            total_chars += len(word)
+        for word, count in words_result._breakdown.items():
+            lower = word.lower()
+            total_syllables += estimate_syllables(lower.strip()) * count
+            total_chars += len(lower) * count
 
         # Calculate averages
         avg_sentence_length = word_count / sentence_count
-        avg_syllables_per_word = total_syllables / max(1, word_count)
-        avg_word_length = total_chars / len(words)
+        avg_syllables_per_word = total_syllables / word_count
+        avg_word_length = total_chars / word_count
 
         # Flesch Reading Ease formula
         flesch_ease = (
@@ -745,7 +766,7 @@ class TextAnalyzer:
            Lower K = more diverse vocabulary
         """
         result = self._counter.word_count(case_sensitive=False)
-        frequencies = result.breakdown
+        frequencies = result._breakdown
         total_words = result.total
         unique_words = len(frequencies)
 
@@ -755,26 +776,18 @@ class TextAnalyzer:
         # Type-Token Ratio
         ttr = unique_words / total_words
 
-        # Hapax legomena (words appearing exactly once)
-        hapax_count = 0
-        for count in frequencies.values():
-            if count == 1:
-                hapax_count += 1
-        hapax_ratio = hapax_count / total_words
+        # Frequency-of-frequencies (spectrum), counted in C
+        freq_spectrum = Counter(frequencies.values())
 
-        # Yule's K characteristic
-        # First, compute frequency-of-frequencies (spectrum)
-        freq_spectrum: Dict[int, int] = {}
-        for count in frequencies.values():
-            if count in freq_spectrum:
-                freq_spectrum[count] += 1
-            else:
-                freq_spectrum[count] = 1
+        # Hapax legomena (words appearing exactly once) are V_1
+        hapax_ratio = freq_spectrum[1] / total_words
 
-        # Calculate sum term: Σ(m² * V_m)
-        sum_term = 0
-        for freq, num_words in freq_spectrum.items():
-            sum_term += (freq**2) * num_words
+        # Yule's K characteristic
+        # Sum term Σ(m² * V_m) over the spectrum: it has only as many
+        # entries as there are distinct frequencies, far fewer than words
+        sum_term = sum(
+            freq * freq * num_words for freq, num_words in freq_spectrum.items()
+        )
 
         # Yule's K formula
         if total_words > 1:
@@ -793,15 +806,8 @@ class TextAnalyzer:
 
         Returns dict mapping word_length -> count of words.
         """
-        words = self._get_words()
-        distribution: Dict[int, int] = {}
-
-        for word in words:
-            length = len(word)
-            if length in distribution:
-                distribution[length] += 1
-            else:
-                distribution[length] = 1
+        # map() with the built-in len keeps the whole histogram loop in C
+        distribution = Counter(map(len, self._get_words()))
 
         # Sort by key (word length)
         return dict(sorted(distribution.items()))
@@ -811,94 +817,61 @@ class TextAnalyzer:
 
         Returns dict mapping sentence_length (in words) -> count.
         """
-        sentences = self._split_sentences()
-        distribution: Dict[int, int] = {}
-
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-
-            # Count words in sentence
-            word_count = 0
-            in_word = False
-            for char in sentence:
-                if char.isspace():
-                    in_word = False
-                elif not in_word:
-                    word_count += 1
-                    in_word = True
-
-            if word_count > 0:
-                if word_count in distribution:
-                    distribution[word_count] += 1
-                else:
-                    distribution[word_count] = 1
+        # A sentence runs up to and including a run of terminators; trailing
+        # text without a terminator forms a final sentence. One precompiled
+        # regex scan yields the spans, and str.split() ignores surrounding
+        # whitespace, so whitespace-only spans (zero words) are skipped
+        # without building an intermediate list of stripped sentences.
+        lengths = map(len, map(str.split, self._SENTENCE_PATTERN.findall(self.text)))
+        distribution = Counter(length for length in lengths if length)
 
         return dict(sorted(distribution.items()))
 
-    def _split_sentences(self) -> List[str]:
-        """Split text into sentences.
-
-        Custom sentence boundary detection without regex.
-        """
-        sentences: List[str] = []
-        current: List[str] = []
-        terminators = frozenset(".!?")
-
-        i = 0
-        while i < len(self._text):
-            char = self._text[i]
-            current.append(char)
-
-            if char in terminators:
-                # Skip consecutive terminators
-                while i + 1 < len(self._text) and self._text[i + 1] in terminators:
-                    i += 1
-                    current.append(self._text[i])
-
-                sentence = "".join(current).strip()
-                if sentence:
-                    sentences.append(sentence)
-                current = []
-
-            i += 1
-
-        # Handle text without ending punctuation
-        if current:
-            sentence = "".join(current).strip()
-            if sentence:
-                sentences.append(sentence)
-
-        return sentences
-
     @property
     def statistics(self) -> TextStatistics:
         """Get comprehensive statistics.
 
         Uses internal caching for performance.
         """
+        cache = self._results()
         cache_key = "statistics"
-        if cache_key not in self._cache:
-            self._cache[cache_key] = self._compute_statistics()
-        result: TextStatistics = self._cache[cache_key]
+        if cache_key not in cache:
+            cache[cache_key] = self._compute_statistics()
+        result: TextStatistics = cache[cache_key]
         return result
 
     def _compute_statistics(self) -> TextStatistics:
-        """Compute all statistics."""
-        char_result = self._counter.char_count()
+        """Compute all statistics.
+
+        Shares work between metrics instead of rescanning the text: the
+        unfiltered character count is the text length, sentence and
+        paragraph counts skip their breakdowns, and both the
+        case-insensitive word frequencies and the average word length are
+        folded from the case-sensitive word breakdown rather than
+        re-tokenizing.
+        """
         word_result = self._counter.word_count()
-        sentence_result = self._counter.sentence_count()
-        paragraph_result = self._counter.paragraph_count()
-
-        words = self._get_words()
+        # Only the totals are used, so skip the per-sentence/paragraph
+        # word-count breakdowns (each a str.split per piece)
+        sentence_result = self._counter.sentence_count(compute_breakdown=False)
+        paragraph_result = self._counter.paragraph_count(compute_breakdown=False)
+        breakdown = word_result._breakdown
+
+        # Lowercasing commutes with boundary-punctuation stripping, so merging
+        # case variants of each token matches word_frequency() exactly. The
+        # same pass sums the lowercased word lengths for the average, as
+        # readability() does.
+        folded: Counter[str] = Counter()
+        total_chars = 0
+        for word, count in breakdown.items():
+            lower = word.lower()
+            folded[lower] += count
+            total_chars += len(lower) * count
 
         # Calculate averages
-        if words:
-            total_chars = sum(len(w) for w in words)
-            avg_word_length = total_chars / len(words)
-        else:
-            avg_word_length = 0.0
+        avg_word_length = (
+            total_chars / word_result.total if word_result.total > 0 else 0.0
+        )
 
         avg_sentence_length = (
             word_result.total / sentence_result.total
@@ -906,13 +879,20 @@ class TextAnalyzer:
             else 0.0
         )
 
-        unique_words = len(word_result.breakdown)
+        unique_words = len(breakdown)
         vocab_richness = (
             unique_words / word_result.total if word_result.total > 0 else 0.0
         )
 
+        word_frequency = FrequencyResult(
+            frequencies=folded,
+            total_items=word_result.total,
+            unique_items=len(folded),
+            most_common=_rank_by_frequency(folded),
+        )
+
         return TextStatistics(
-            char_count=char_result.total,
+            char_count=len(self._counter.text),
             word_count=word_result.total,
             unique_word_count=unique_words,
             sentence_count=sentence_result.total,
@@ -921,12 +901,12 @@ class TextAnalyzer:
             avg_sentence_length=round(avg_sentence_length, 2),
             vocabulary_richness=round(vocab_richness, 4),
             char_frequency=self.char_frequency(),
-            word_frequency=self.word_frequency(),
+            word_frequency=word_frequency,
         )
 
     def get_statistics(self) -> TextStatistics:
-        """Get statistics (method version)."""
-        return self._compute_statistics()
+        """Get statistics (method version, shares the property's cache)."""
+        return self.statistics
 
     def find_patterns(
         self,
@@ -938,44 +918,141 @@ class TextAnalyzer:
         Returns list of (start, end, matched_text) tuples.
         """
         flags = 0 if case_sensitive else re.IGNORECASE
-        matches: List[Tuple[int, int, str]] = []
-
-        for match in re.finditer(pattern, self._text, flags):
-            matches.append((match.start(), match.end(), match.group()))
-
-        return matches
+        regex = _compile_pattern(pattern, flags)
+        return [
+            (match.start(), match.end(), match.group())
+            for match in regex.finditer(self.text)
+        ]
 
     def extract_emails(self) -> List[str]:
         """Extract email addresses."""
-        return self._EMAIL_PATTERN.findall(self._text)
+        return self._EMAIL_PATTERN.findall(self.text)
 
     def extract_urls(self) -> List[str]:
         """Extract URLs with trailing punctuation stripped."""
-        urls = self._URL_PATTERN.findall(self._text)
-
-        # Strip trailing punctuation manually
-        cleaned: List[str] = []
-        trailing = set(".,;:!?)")
-        for url in urls:
-            while url and url[-1] in trailing:
-                url = url[:-1]
-            if url:
-                cleaned.append(url)
-
-        return cleaned
+        trailing = self._URL_TRAILING
+        return [
+            url
+            for url in (
+                match.rstrip(trailing) for match in self._URL_PATTERN.findall(self.text)
+            )
+            if url
+        ]
 
     def extract_numbers(self) -> List[str]:
         """Extract numeric values."""
-        return self._NUMBER_PATTERN.findall(self._text)
+        return self._NUMBER_PATTERN.findall(self.text)
+
+    def _cached_comparison_stats(self) -> Optional[_ComparisonStats]:
+        """Return ``compare`` metrics from cached statistics, if any."""
+        cached: Optional[TextStatistics] = self._results().get("statistics")
+        if cached is None:
+            return None
+        return _ComparisonStats(
+            word_count=cached.word_count,
+            char_count=cached.char_count,
+            avg_word_length=cached.avg_word_length,
+            vocabulary_richness=cached.vocabulary_richness,
+        )
+
+    def _comparison_stats(self) -> _ComparisonStats:
+        """Compute the metrics ``compare`` needs.
+
+        Skips the character and word frequency results that full statistics
+        build, reusing the statistics instead when they are already cached.
+        """
+        cached = self._cached_comparison_stats()
+        if cached is not None:
+            return cached
+
+        word_result = self._counter.word_count()
+        breakdown = word_result._breakdown
+        total = word_result.total
+
+        if total > 0:
+            total_chars = sum(
+                len(word.lower()) * count for word, count in breakdown.items()
+            )
+            avg_word_length = total_chars / total
+            vocab_richness = len(breakdown) / total
+        else:
+            avg_word_length = vocab_richness = 0.0
+
+        return _ComparisonStats(
+            word_count=total,
+            char_count=len(self._counter.text),
+            avg_word_length=round(avg_word_length, 2),
+            vocabulary_richness=round(vocab_richness, 4),
+        )
 
     def compare(self, other: "TextAnalyzer") -> Dict[str, Dict[str, float]]:
         """Compare with another text.
 
         Returns comparison metrics with differences.
         """
-        stats1 = self._compute_statistics()
-        stats2 = other._compute_statistics()
+        return self._comparison_report(
+            self._comparison_stats(), other._comparison_stats()
+        )
+
+    def compare_many(
+        self, others: Sequence["TextAnalyzer"], processes: Optional[int] = 1
+    ) -> List[Dict[str, Dict[str, float]]]:
+        """Compare with several texts, optionally in worker processes.
+
+        By default everything runs in this process, reusing the analyzers'
+        caches: starting a pool costs tens of milliseconds, more than
+        analyzing typical texts. For large batches of long texts, pass
+        ``processes`` to compute the metrics of analyzers without cached
+        statistics in a ``multiprocessing.Pool``, which receives the texts
+        in chunks to amortize inter-process overhead.
+
+        On platforms that start workers with spawn or forkserver (Windows,
+        macOS), the calling script must guard its entry point with
+        ``if __name__ == "__main__":``, as for any ``multiprocessing`` use.
+
+        Args:
+            others: Analyzers to compare against.
+            processes: Number of worker processes; ``None`` uses the CPU
+                count. With one worker or fewer, or when at most one text
+                needs analyzing, no pool is started.
+
+        Returns:
+            One ``compare()`` result per analyzer, in the order given.
+        """
+        stats1 = self._comparison_stats()
+        workers = (os.cpu_count() or 1) if processes is None else processes
 
+        if workers <= 1:
+            others_stats = [other._comparison_stats() for other in others]
+        else:
+            cached = [other._cached_comparison_stats() for other in others]
+            pending = [i for i, stats in enumerate(cached) if stats is None]
+            if len(pending) < 2:
+                computed = [others[i]._comparison_stats() for i in pending]
+            else:
+                # Deferred: most callers never need the multiprocessing machinery
+                from multiprocessing import Pool
+
+                workers = min(workers, len(pending))
+                chunksize = max(1, len(pending) // (4 * workers))
+                with Pool(workers) as pool:
+                    computed = pool.map(
+                        _text_comparison_stats,
+                        [others[i].text for i in pending],
+                        chunksize,
+                    )
+            fresh = iter(computed)
+            others_stats = [
+                stats if stats is not None else next(fresh) for stats in cached
+            ]
+
+        return [self._comparison_report(stats1, stats2) for stats2 in others_stats]
+
+    @staticmethod
+    def _comparison_report(
+        stats1: _ComparisonStats, stats2: _ComparisonStats
+    ) -> Dict[str, Dict[str, float]]:
+        """Build the ``compare`` result for two sets of metrics."""
         return {
             "word_count": {
                 "text1": float(stats1.word_count),
@@ -1003,12 +1080,18 @@ class TextAnalyzer:
 
     def __repr__(self) -> str:
         """Debug representation."""
-        preview = self._text[:40] + "..." if len(self._text) > 40 else self._text
+        text = self.text
+        preview = text[:40] + "..." if len(text) > 40 else text
         return f"TextAnalyzer({preview!r})"
 
     def __str__(self) -> str:
         """Human-readable summary."""
-        stats = self._compute_statistics()
+        stats = self.statistics
         return (
             f"TextAnalyzer: {stats.word_count} words, {stats.sentence_count} sentences"
         )
+
+
+def _text_comparison_stats(text: str) -> _ComparisonStats:
+    """Compute comparison metrics for a text (picklable pool worker)."""
+    return TextAnalyzer(text)._comparison_stats()
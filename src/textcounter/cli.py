@@ -9,9 +9,17 @@ from __future__ import annotations
 
 import argparse
 import sys
-from typing import Optional
+from typing import Any, Iterator, Optional
 
-from textcounter import TextAnalyzer, TextCounter, __version__
+from textcounter._version import __version__
+
+
+def _positive_int(value: str) -> int:
+    """Parse an integer argument that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -149,7 +157,7 @@ def create_parser() -> argparse.ArgumentParser:
 
     analysis_group.add_argument(
         "--ngrams",
-        type=int,
+        type=_positive_int,
         metavar="N",
         help="Show N-gram analysis (e.g., --ngrams 2 for bigrams)",
     )
@@ -233,28 +241,59 @@ def format_output(
     return f"{label}: {value}"
 
 
-def main(argv: Optional[list[str]] = None) -> int:
-    """Main entry point for the CLI.
+def print_result(key: str, value: Any, quiet: bool = False) -> None:
+    """Print one named result in the plain-text format.
 
     Args:
-        argv: Command-line arguments (defaults to sys.argv[1:]).
-
-    Returns:
-        Exit code (0 for success).
+        key: Result name.
+        value: A scalar, or a dict of scalars and (label, count) lists.
+        quiet: If True, omit labels and headers.
     """
-    parser = create_parser()
-    args = parser.parse_args(argv)
+    if not isinstance(value, dict):
+        print(format_output(key, value, quiet))
+        return
+
+    if not quiet:
+        print(f"\n{key.upper()}:")
+    for k, v in value.items():
+        if isinstance(v, (list, tuple)):
+            if not quiet:
+                print(f"  {k}:")
+            for item in v:
+                if isinstance(item, tuple):
+                    print(f"    {item[0]}: {item[1]}")
+                else:
+                    print(f"    {item}")
+        else:
+            print(format_output(f"  {k}", v, quiet))
 
-    # Get text to analyze
-    text = get_text(args)
 
-    if not text.strip():
-        print("Warning: Empty text provided.", file=sys.stderr)
+def _iter_results(
+    args: argparse.Namespace, text: str
+) -> Iterator[tuple[str, int | float | str | dict]]:
+    """Compute the results requested by ``args``, one section at a time.
+
+    Results are produced lazily so the plain-text output can print each one
+    as soon as it is ready instead of waiting for slow analyses.
+
+    Args:
+        args: Parsed command-line arguments.
+        text: The text to analyze.
+
+    Yields:
+        ``(name, value)`` pairs in output order.
+    """
+    # Deferred so --help, --version and usage errors skip loading the
+    # counting modules
+    from textcounter import TextCounter
 
     counter = TextCounter(text)
-    analyzer = TextAnalyzer(text)
 
-    results: dict[str, int | float | str | dict] = {}
+    # Counting-only runs never load the analyzer module
+    if args.frequency or args.readability or args.ngrams or args.stats:
+        from textcounter import TextAnalyzer
+
+        analyzer = TextAnalyzer(text, counter=counter)
 
     # Determine what to count
     show_all = args.all or not any(
@@ -277,8 +316,9 @@ def main(argv: Optional[list[str]] = None) -> int:
             ignore_spaces=args.no_spaces,
             ignore_punctuation=args.no_punctuation,
             ignore_digits=args.no_digits,
+            compute_breakdown=False,
         )
-        results["characters"] = result.total
+        yield ("characters", result.total)
 
     # Word count
     if args.words or show_all:
@@ -286,23 +326,24 @@ def main(argv: Optional[list[str]] = None) -> int:
             ignore_punctuation=args.no_punctuation,
             min_length=args.min_length,
             unique_only=args.unique,
+            compute_breakdown=False,
         )
-        results["words"] = result.total
+        yield ("words", result.total)
 
     # Line count
     if args.lines or show_all:
-        result = counter.line_count()
-        results["lines"] = result.total
+        result = counter.line_count(compute_breakdown=False)
+        yield ("lines", result.total)
 
     # Sentence count
     if args.sentences or show_all:
-        result = counter.sentence_count()
-        results["sentences"] = result.total
+        result = counter.sentence_count(compute_breakdown=False)
+        yield ("sentences", result.total)
 
     # Paragraph count
     if args.paragraphs or show_all:
-        result = counter.paragraph_count()
-        results["paragraphs"] = result.total
+        result = counter.paragraph_count(compute_breakdown=False)
+        yield ("paragraphs", result.total)
 
     # Frequency analysis
     if args.frequency:
@@ -317,71 +358,115 @@ def main(argv: Optional[list[str]] = None) -> int:
                 min_length=args.min_length,
                 top_n=args.top,
             )
-        results["frequency"] = {
-            "most_common": freq.most_common,
-            "unique_count": freq.unique_items,
-            "total_count": freq.total_items,
-        }
+        yield (
+            "frequency",
+            {
+                "most_common": freq.most_common,
+                "unique_count": freq.unique_items,
+                "total_count": freq.total_items,
+            },
+        )
 
     # Readability analysis
     if args.readability:
         read = analyzer.readability()
-        results["readability"] = {
-            "flesch_reading_ease": read.flesch_reading_ease,
-            "flesch_kincaid_grade": read.flesch_kincaid_grade,
-            "avg_sentence_length": read.avg_sentence_length,
-            "avg_word_length": read.avg_word_length,
-            "complexity_rating": read.complexity_rating,
-        }
+        yield (
+            "readability",
+            {
+                "flesch_reading_ease": read.flesch_reading_ease,
+                "flesch_kincaid_grade": read.flesch_kincaid_grade,
+                "avg_sentence_length": read.avg_sentence_length,
+                "avg_word_length": read.avg_word_length,
+                "complexity_rating": read.complexity_rating,
+            },
+        )
 
     # N-gram analysis
     if args.ngrams:
         ngrams = analyzer.ngrams(n=args.ngrams, top_n=args.top)
-        results["ngrams"] = {
-            "n": args.ngrams,
-            "most_common": ngrams.most_common,
-            "unique_count": ngrams.unique_items,
-        }
+        yield (
+            "ngrams",
+            {
+                "n": args.ngrams,
+                "most_common": ngrams.most_common,
+                "unique_count": ngrams.unique_items,
+            },
+        )
 
     # Comprehensive statistics
     if args.stats:
         stats = analyzer.statistics
         richness = analyzer.vocabulary_richness()
-        results["statistics"] = {
-            "char_count": stats.char_count,
-            "word_count": stats.word_count,
-            "sentence_count": stats.sentence_count,
-            "paragraph_count": stats.paragraph_count,
-            "avg_word_length": stats.avg_word_length,
-            "avg_sentence_length": stats.avg_sentence_length,
-            "vocabulary_richness": stats.vocabulary_richness,
-            "ttr": richness["ttr"],
-            "hapax_ratio": richness["hapax_ratio"],
-        }
+        yield (
+            "statistics",
+            {
+                "char_count": stats.char_count,
+                "word_count": stats.word_count,
+                "sentence_count": stats.sentence_count,
+                "paragraph_count": stats.paragraph_count,
+                "avg_word_length": stats.avg_word_length,
+                "avg_sentence_length": stats.avg_sentence_length,
+                "vocabulary_richness": stats.vocabulary_richness,
+                "ttr": richness["ttr"],
+                "hapax_ratio": richness["hapax_ratio"],
+            },
+        )
+
+
+def compute(
+    argv: Optional[list[str]] = None,
+    parser: Optional[argparse.ArgumentParser] = None,
+) -> dict[str, Any]:
+    """Compute the CLI's results without formatting or printing them.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:]).
+        parser: Parser from ``create_parser()`` to reuse.
+
+    Returns:
+        The results ``--json`` would print, keyed by section name. N-gram
+        and frequency rankings hold tuples where the JSON has lists.
+    """
+    if parser is None:
+        parser = create_parser()
+    args = parser.parse_args(argv)
+    return dict(_iter_results(args, get_text(args)))
+
+
+def main(
+    argv: Optional[list[str]] = None,
+    parser: Optional[argparse.ArgumentParser] = None,
+) -> int:
+    """Main entry point for the CLI.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:]).
+        parser: Parser from ``create_parser()`` to reuse, so callers running
+            many invocations build it only once.
+
+    Returns:
+        Exit code (0 for success).
+    """
+    if parser is None:
+        parser = create_parser()
+    args = parser.parse_args(argv)
+
+    # Get text to analyze
+    text = get_text(args)
+
+    if not text.strip():
+        print("Warning: Empty text provided.", file=sys.stderr)
+
+    results = _iter_results(args, text)
 
     # Output results
     if args.json:
         import json
 
-        print(json.dumps(results, indent=2))
+        print(json.dumps(dict(results), indent=2))
     else:
-        for key, value in results.items():
-            if isinstance(value, dict):
-                if not args.quiet:
-                    print(f"\n{key.upper()}:")
-                for k, v in value.items():
-                    if isinstance(v, list):
-                        if not args.quiet:
-                            print(f"  {k}:")
-                        for item in v:
-                            if isinstance(item, tuple):
-                                print(f"    {item[0]}: {item[1]}")
-                            else:
-                                print(f"    {item}")
-                    else:
-                        print(format_output(f"  {k}", v, args.quiet))
-            else:
-                print(format_output(key, value, args.quiet))
+        for key, value in results:
+            print_result(key, value, args.quiet)
 
     return 0
 
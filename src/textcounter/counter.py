@@ -9,9 +9,29 @@ deep understanding of Python's data model.
 
 from __future__ import annotations
 
+import heapq
 import re
 import string
-from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+import sys
+import threading
+from collections import Counter
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+
+def _frequency_key(item: Tuple[str, int]) -> Tuple[int, str]:
+    """Sort key ordering by frequency descending, then alphabetically."""
+    return (-item[1], item[0])
 
 
 class CountResult:
@@ -30,7 +50,14 @@ class CountResult:
         options_applied: List of filtering options that were applied.
     """
 
-    __slots__ = ("_total", "_breakdown", "_text_length", "_options_applied", "_hash")
+    __slots__ = (
+        "_total",
+        "_breakdown",
+        "_text_length",
+        "_options_applied",
+        "_hash",
+        "_sorted",
+    )
 
     def __init__(
         self,
@@ -46,8 +73,12 @@ class CountResult:
         self._total = total
         self._breakdown = breakdown if breakdown is not None else {}
         self._text_length = text_length
-        self._options_applied = options_applied if options_applied is not None else []
+        # Stored as a tuple so callers' lists are not aliased; () is shared
+        self._options_applied: Tuple[str, ...] = (
+            tuple(options_applied) if options_applied else ()
+        )
         self._hash: Optional[int] = None
+        self._sorted: Optional[List[Tuple[str, int]]] = None
 
     # Read-only properties with validation
     @property
@@ -180,13 +211,14 @@ class CountResult:
     def __hash__(self) -> int:
         """Compute hash (cached for performance)."""
         if self._hash is None:
-            # Use tuple of immutable components for hashing
+            # Use tuple of immutable components for hashing; the frozenset
+            # hashes the breakdown order-independently without sorting it
             self._hash = hash(
                 (
                     self._total,
-                    tuple(sorted(self._breakdown.items())),
+                    frozenset(self._breakdown.items()),
                     self._text_length,
-                    tuple(self._options_applied),
+                    self._options_applied,
                 )
             )
         return self._hash
@@ -202,7 +234,7 @@ class CountResult:
         return (
             f"CountResult(total={self._total}, "
             f"unique={len(self._breakdown)}, "
-            f"options={self._options_applied})"
+            f"options={list(self._options_applied)})"
         )
 
     def __str__(self) -> str:
@@ -216,7 +248,7 @@ class CountResult:
             "total": self._total,
             "breakdown": self._breakdown,
             "text_length": self._text_length,
-            "options_applied": self._options_applied,
+            "options_applied": list(self._options_applied),
             "unique_count": len(self._breakdown),
         }
 
@@ -245,71 +277,35 @@ class CountResult:
 
     def __iter__(self) -> Iterator[Tuple[str, int]]:
         """Iterate over breakdown items sorted by frequency."""
-        # Custom sorting without using Counter.most_common
-        items = list(self._breakdown.items())
-        # In-place sort by value descending, then by key ascending
-        self._quicksort_by_frequency(items, 0, len(items) - 1)
-        return iter(items)
-
-    def _quicksort_by_frequency(
-        self, items: List[Tuple[str, int]], low: int, high: int
-    ) -> None:
-        """Custom quicksort implementation for sorting by frequency.
-
-        Sorts in-place by frequency (descending), then alphabetically.
-        Demonstrates algorithm implementation skills.
-        """
-        if low < high:
-            pivot_idx = self._partition(items, low, high)
-            self._quicksort_by_frequency(items, low, pivot_idx - 1)
-            self._quicksort_by_frequency(items, pivot_idx + 1, high)
-
-    def _partition(self, items: List[Tuple[str, int]], low: int, high: int) -> int:
-        """Partition helper for quicksort."""
-        pivot = items[high]
-        i = low - 1
-
-        for j in range(low, high):
-            # Sort by frequency descending, then key ascending
-            if self._compare_items(items[j], pivot) < 0:
-                i += 1
-                items[i], items[j] = items[j], items[i]
+        return iter(self._ranked())
 
-        items[i + 1], items[high] = items[high], items[i + 1]
-        return i + 1
+    def _ranked(self) -> List[Tuple[str, int]]:
+        """Breakdown items by frequency, then key (sorted once, cached).
 
-    @staticmethod
-    def _compare_items(a: Tuple[str, int], b: Tuple[str, int]) -> int:
-        """Compare two (key, count) tuples.
-
-        Returns negative if a should come before b.
-        Primary: frequency descending
-        Secondary: key ascending (alphabetical)
+        Callers must treat the returned list as read-only.
         """
-        if a[1] != b[1]:
-            return b[1] - a[1]  # Higher frequency first
-        if a[0] < b[0]:
-            return -1
-        if a[0] > b[0]:
-            return 1
-        return 0
+        if self._sorted is None:
+            self._sorted = sorted(self._breakdown.items(), key=_frequency_key)
+        return self._sorted
 
     def most_common(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
         """Get most frequent items.
 
         Custom implementation without using collections.Counter.
-        Uses partial selection algorithm for efficiency when n is small.
+        When ``n`` is given and no full ranking is cached yet, a bounded
+        heap selects the top items in O(u log n) instead of sorting the
+        whole breakdown.
         """
-        items = list(self._breakdown.items())
-
-        if not items:
+        if not self._breakdown:
             return []
 
-        # Sort all items
-        self._quicksort_by_frequency(items, 0, len(items) - 1)
+        if n is not None and n >= 0 and self._sorted is None:
+            return heapq.nsmallest(n, self._breakdown.items(), key=_frequency_key)
+
+        items = self._ranked()
 
         if n is None:
-            return items
+            return list(items)
         return items[:n]
 
 
@@ -327,7 +323,7 @@ class TextCounter:
         10
     """
 
-    __slots__ = ("_text", "_summary_cache")
+    __slots__ = ("_text", "_summary_cache", "_token_cache", "_lower_cache")
 
     # Pre-computed character sets as frozensets for O(1) lookup
     PUNCTUATION: frozenset = frozenset(string.punctuation)
@@ -336,12 +332,56 @@ class TextCounter:
     LETTERS: frozenset = frozenset(string.ascii_letters)
     VOWELS: frozenset = frozenset("aeiouAEIOU")
 
+    # Boundaries for sentence and paragraph splitting; a blank line is two
+    # adjacent newlines (a line holding only spaces does not break)
+    _SENTENCE_SPLIT_PATTERN = re.compile(r"[.!?]+")
+    _PARAGRAPH_SPLIT_PATTERN = re.compile(r"\n{2,}")
+
+    # Word tokenization: runs of ASCII whitespace separate words. The
+    # stripped form captures from the first to the last non-punctuation
+    # character; the lookbehind anchors each match to the start of its run,
+    # so an all-punctuation run fails in linear time instead of being
+    # retried from every offset.
+    _WS_CLASS = re.escape(string.whitespace)
+    _PUNCT_CLASS = re.escape(string.punctuation)
+    _WORD_PATTERN = re.compile(f"[^{_WS_CLASS}]+")
+    _STRIPPED_WORD_PATTERN = re.compile(
+        f"(?<![^{_WS_CLASS}])[{_PUNCT_CLASS}]*"
+        f"([^{_WS_CLASS}{_PUNCT_CLASS}](?:[^{_WS_CLASS}]*[^{_WS_CLASS}{_PUNCT_CLASS}])?)"
+    )
+    # ASCII separators str.split() breaks on that string.whitespace lacks
+    _SPLIT_ONLY_WHITESPACE = "\x1c\x1d\x1e\x1f"
+
+    # Filter sets keyed by char_count's ignore arguments, and str.translate
+    # deletion tables keyed by the ignored characters; shared across
+    # instances and bounded so custom_ignore values can't grow them
+    _FILTER_SETS: Dict[
+        Tuple[bool, bool, bool, bool, bool, Optional[str]],
+        Tuple[FrozenSet[str], Tuple[str, ...]],
+    ] = {}
+    _DELETE_TABLES: Dict[FrozenSet[str], Dict[int, None]] = {}
+    _FILTER_CACHE_MAX = 64
+    # Summaries shared by counters over equal texts, stored as tuples so no
+    # instance can mutate another's results. Keyed by the text's length and
+    # hash (cached on the str); each entry keeps its text so a hash
+    # collision is detected on lookup instead of returning another text's
+    # counts. Only texts up to _SUMMARY_TEXT_MAX characters are shared, so
+    # the cache never keeps large documents alive. The oldest entry is
+    # evicted first; the lock keeps concurrent inserts from evicting the
+    # same key.
+    _SUMMARIES: Dict[Tuple[int, int], Tuple[str, Tuple[Tuple[str, int], ...]]] = {}
+    _SUMMARY_CACHE_MAX = 32
+    _SUMMARY_TEXT_MAX = 1 << 16
+    _SUMMARY_LOCK = threading.Lock()
+
     def __init__(self, text: str = "") -> None:
         """Initialize with text validation."""
         if not isinstance(text, str):
             raise TypeError(f"Expected str, got {type(text).__name__}")
         self._text = text
         self._summary_cache: Optional[Dict[str, int]] = None
+        self._token_cache: Dict[Tuple[bool, bool], List[str]] = {}
+        self._lower_cache: Optional[str] = None
 
     @property
     def text(self) -> str:
@@ -355,6 +395,8 @@ class TextCounter:
             raise TypeError(f"Expected str, got {type(value).__name__}")
         self._text = value
         self._summary_cache = None
+        self._token_cache.clear()
+        self._lower_cache = None
 
     # Context manager protocol
     def __enter__(self) -> "TextCounter":
@@ -362,8 +404,10 @@ class TextCounter:
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Exit context - clears cache to free memory."""
+        """Exit context - clears caches to free memory."""
         self._summary_cache = None
+        self._token_cache.clear()
+        self._lower_cache = None
 
     # Iterator protocol
     def __iter__(self) -> Iterator[str]:
@@ -418,14 +462,30 @@ class TextCounter:
         ignore_digits: bool,
         ignore_newlines: bool,
         custom_ignore: Optional[str],
-    ) -> Tuple[Set[str], List[str]]:
+        case_sensitive: bool = True,
+    ) -> Tuple[FrozenSet[str], List[str]]:
         """Build optimized character filter set.
 
         Returns tuple of (chars_to_ignore, options_applied).
-        Uses set operations for O(1) lookup during filtering.
+        Uses set operations for O(1) lookup during filtering. Filter sets
+        are cached per flag combination; the options list is a fresh copy
+        that callers may extend, already led by ``"case_insensitive"`` when
+        ``case_sensitive`` is False.
         """
+        cache_key = (
+            case_sensitive,
+            ignore_spaces,
+            ignore_punctuation,
+            ignore_digits,
+            ignore_newlines,
+            custom_ignore,
+        )
+        cached = self._FILTER_SETS.get(cache_key)
+        if cached is not None:
+            return cached[0], list(cached[1])
+
         ignore: Set[str] = set()
-        options: List[str] = []
+        options: List[str] = [] if case_sensitive else ["case_insensitive"]
 
         if ignore_spaces:
             ignore.add(" ")
@@ -448,7 +508,34 @@ class TextCounter:
             ignore.update(custom_ignore)
             options.append("custom_ignore")
 
-        return ignore, options
+        frozen = frozenset(ignore)
+        if len(self._FILTER_SETS) < self._FILTER_CACHE_MAX:
+            self._FILTER_SETS[cache_key] = (frozen, tuple(options))
+        return frozen, options
+
+    @classmethod
+    def _deletion_table(cls, chars: FrozenSet[str]) -> Dict[int, None]:
+        """Get a cached ``str.translate`` table that deletes ``chars``."""
+        table = cls._DELETE_TABLES.get(chars)
+        if table is None:
+            table = dict.fromkeys(map(ord, chars))
+            if len(cls._DELETE_TABLES) < cls._FILTER_CACHE_MAX:
+                cls._DELETE_TABLES[chars] = table
+        return table
+
+    @staticmethod
+    def _fold_case(counts: Dict[str, int]) -> Dict[str, int]:
+        """Merge character counts as if the text had been lowercased.
+
+        A lowercase mapping may expand to several characters (``"İ"``
+        becomes ``"i"`` plus a combining dot), so each one is credited.
+        First-occurrence order is preserved.
+        """
+        folded: Dict[str, int] = {}
+        for char, count in counts.items():
+            for lower in char.lower():
+                folded[lower] = folded.get(lower, 0) + count
+        return folded
 
     def char_count(
         self,
@@ -459,11 +546,12 @@ class TextCounter:
         case_sensitive: bool = True,
         custom_ignore: Optional[str] = None,
         count_only: Optional[str] = None,
+        compute_breakdown: bool = True,
     ) -> CountResult:
         """Count characters with O(n) single-pass algorithm.
 
         Uses hash-based frequency counting for optimal performance.
-        All filtering is done in a single pass through the text.
+        Filters are applied once per distinct character after counting.
 
         Args:
             ignore_spaces: Exclude space characters.
@@ -473,11 +561,13 @@ class TextCounter:
             case_sensitive: If False, normalize to lowercase.
             custom_ignore: Additional characters to exclude.
             count_only: If set, count ONLY these characters.
+            compute_breakdown: If False, only the total is computed and the
+                breakdown is left empty.
 
         Returns:
             CountResult with count and frequency breakdown.
         """
-        text = self._text if case_sensitive else self._text.lower()
+        text = self._text
 
         ignore_set, options = self._build_filter_set(
             ignore_spaces,
@@ -485,33 +575,66 @@ class TextCounter:
             ignore_digits,
             ignore_newlines,
             custom_ignore,
+            case_sensitive,
         )
 
-        if not case_sensitive:
-            options.insert(0, "case_insensitive")
+        if not compute_breakdown:
+            # Lowercasing ASCII text never changes its length, so the copy
+            # is only needed when it decides which characters are counted
+            if not case_sensitive and not (
+                count_only is None
+                and text.isascii()
+                and ignore_set.isdisjoint(self.LETTERS)
+            ):
+                text = self._lowered_text()
+
+            # Totals come from C-level scans without building a histogram
+            if count_only is not None:
+                options.append("count_only")
+                total = sum(map(text.count, set(count_only)))
+            elif ignore_set and text.isascii():
+                # translate has an ASCII fast path and deletes in one scan
+                total = len(text.translate(self._deletion_table(ignore_set)))
+            elif ignore_set:
+                # Wide strings fall off translate's fast path; per-character
+                # str.count scans stay in C and are much cheaper there
+                total = len(text) - sum(map(text.count, ignore_set))
+            else:
+                total = len(text)
+            return CountResult(
+                total=total,
+                breakdown={},
+                text_length=len(self._text),
+                options_applied=options,
+            )
 
-        # Single-pass frequency counting
-        breakdown: Dict[str, int] = {}
+        # Single-pass frequency counting runs in C inside Counter; filters
+        # then touch each distinct character once instead of every position.
+        # Counter keeps first-occurrence order, so the breakdown ordering
+        # matches a left-to-right scan. Case folding is applied to the
+        # distinct characters rather than to a lowered copy of the text,
+        # except that capital sigma lowercases by context (final "ς").
+        counts: Dict[str, int] = Counter(text)
+        if not case_sensitive:
+            if "\u03a3" in counts:
+                counts = Counter(self._lowered_text())
+            else:
+                counts = self._fold_case(counts)
+        breakdown: Dict[str, int]
 
         if count_only is not None:
             # Optimization: convert to set once for O(1) lookup
             count_set = set(count_only)
             options.append("count_only")
-
-            for char in text:
-                if char in count_set:
-                    # Direct dict manipulation is faster than .get()
-                    if char in breakdown:
-                        breakdown[char] += 1
-                    else:
-                        breakdown[char] = 1
+            breakdown = {
+                char: count for char, count in counts.items() if char in count_set
+            }
+        elif ignore_set:
+            breakdown = {
+                char: count for char, count in counts.items() if char not in ignore_set
+            }
         else:
-            for char in text:
-                if char not in ignore_set:
-                    if char in breakdown:
-                        breakdown[char] += 1
-                    else:
-                        breakdown[char] = 1
+            breakdown = dict(counts)
 
         # Calculate total from breakdown (avoids second pass)
         total = sum(breakdown.values())
@@ -531,11 +654,13 @@ class TextCounter:
         max_length: Optional[int] = None,
         unique_only: bool = False,
         case_sensitive: bool = True,
+        compute_breakdown: bool = True,
     ) -> CountResult:
         """Count words with configurable filtering.
 
-        Uses custom word tokenization without external libraries.
-        Implements streaming filter pipeline for memory efficiency.
+        Uses custom word tokenization without external libraries; tokens
+        are cached per case and punctuation mode until the text changes,
+        and filters stream over the cached list.
 
         Args:
             ignore_punctuation: Strip punctuation from word boundaries.
@@ -544,47 +669,40 @@ class TextCounter:
             max_length: Maximum word length (None = unlimited).
             unique_only: Count each unique word once.
             case_sensitive: Treat 'Word' and 'word' as different.
+            compute_breakdown: If False, only the total is computed and the
+                breakdown is left empty.
 
         Returns:
             CountResult with word count and frequency breakdown.
         """
-        text = self._text if case_sensitive else self._text.lower()
         options: List[str] = []
 
         if not case_sensitive:
             options.append("case_insensitive")
 
         # Custom word extraction without relying on complex regex
-        words = self._extract_words(text, ignore_punctuation)
+        words: Iterable[str] = self._get_words(case_sensitive, ignore_punctuation)
 
         if ignore_punctuation:
             options.append("ignore_punctuation")
 
-        # Build frequency map with filtering in single pass
-        breakdown: Dict[str, int] = {}
-        total_count = 0
-
-        for word in words:
-            # Apply filters
-            if not word:
-                continue
-
-            if ignore_numbers and self._is_numeric(word):
-                continue
-
-            word_len = len(word)
-            if word_len < min_length:
-                continue
-
-            if max_length is not None and word_len > max_length:
-                continue
+        # Chain only the active filters, then tally in C with Counter. Both
+        # length bounds share one chained comparison and run before the
+        # costlier numeric check.
+        if min_length > 1 or max_length is not None:
+            upper = sys.maxsize if max_length is None else max_length
+            words = (word for word in words if min_length <= len(word) <= upper)
+        if ignore_numbers:
+            is_numeric = self._is_numeric
+            words = (word for word in words if not is_numeric(word))
 
-            # Count word
-            if word in breakdown:
-                breakdown[word] += 1
-            else:
-                breakdown[word] = 1
-            total_count += 1
+        breakdown: Dict[str, int]
+        if compute_breakdown:
+            breakdown = dict(Counter(words))
+            total = len(breakdown) if unique_only else sum(breakdown.values())
+        else:
+            breakdown = {}
+            total = len(set(words)) if unique_only else sum(1 for _ in words)
 
         # Build options list
         if ignore_numbers:
@@ -597,133 +715,107 @@ class TextCounter:
             options.append("unique_only")
 
         return CountResult(
-            total=len(breakdown) if unique_only else total_count,
+            total=total,
             breakdown=breakdown,
             text_length=len(self._text),
             options_applied=options,
         )
 
-    def _extract_words(self, text: str, strip_punctuation: bool) -> Iterator[str]:
-        """Extract words from text using custom tokenization.
+    def _get_words(self, case_sensitive: bool, strip_punctuation: bool) -> List[str]:
+        """Get the token list for a case/punctuation mode, caching it.
 
-        Generator-based for memory efficiency with large texts.
-        Does not rely on external tokenizers.
+        Callers must treat the returned list as read-only.
         """
-        current_word: List[str] = []
-
-        for char in text:
-            if char in self.WHITESPACE:
-                if current_word:
-                    word = "".join(current_word)
-                    if strip_punctuation:
-                        word = self._strip_punctuation(word)
-                    if word:
-                        yield word
-                    current_word = []
+        cache_key = (case_sensitive, strip_punctuation)
+        words = self._token_cache.get(cache_key)
+        if words is None:
+            if case_sensitive:
+                words = self._extract_words(self._text, strip_punctuation)
             else:
-                current_word.append(char)
-
-        # Don't forget last word
-        if current_word:
-            word = "".join(current_word)
-            if strip_punctuation:
-                word = self._strip_punctuation(word)
-            if word:
-                yield word
-
-    def _strip_punctuation(self, word: str) -> str:
-        """Strip punctuation from word boundaries.
+                # Lowercasing never creates or removes whitespace or ASCII
+                # punctuation, so folding the tokens matches tokenizing a
+                # lowered copy of the text without allocating one
+                words = list(map(str.lower, self._get_words(True, strip_punctuation)))
+            self._token_cache[cache_key] = words
+        return words
+
+    def _lowered_text(self) -> str:
+        """Get the lowercased text, computed once per text."""
+        if self._lower_cache is None:
+            self._lower_cache = self._text.lower()
+        return self._lower_cache
+
+    def _extract_words(self, text: str, strip_punctuation: bool) -> List[str]:
+        """Extract words from text using custom tokenization.
 
-        Custom implementation without using str.strip() with argument
-        to demonstrate string manipulation understanding.
+        Words are runs of non-whitespace; with ``strip_punctuation`` the
+        boundary punctuation is excluded and all-punctuation runs are
+        dropped. Either way it is a single precompiled regex scan, except
+        that plain runs in ASCII text come from the faster ``str.split()``
+        when both agree on what whitespace is.
+        Does not rely on external tokenizers.
         """
-        if not word:
-            return word
-
-        # Find start index (first non-punctuation)
-        start = 0
-        while start < len(word) and word[start] in self.PUNCTUATION:
-            start += 1
-
-        # Find end index (last non-punctuation)
-        end = len(word) - 1
-        while end >= start and word[end] in self.PUNCTUATION:
-            end -= 1
-
-        return word[start : end + 1]
+        if strip_punctuation:
+            return self._STRIPPED_WORD_PATTERN.findall(text)
+        if text.isascii() and not any(
+            map(text.__contains__, self._SPLIT_ONLY_WHITESPACE)
+        ):
+            return text.split()
+        return self._WORD_PATTERN.findall(text)
 
     @staticmethod
     def _is_numeric(word: str) -> bool:
         """Check if word is purely numeric.
 
-        Custom implementation without using str.isdigit() to handle
-        edge cases like negative numbers and decimals.
+        Accepts an optional leading minus followed by digits, where any
+        decimal points must come after the first digit (``"-1.5"``,
+        ``"3."``). Checked with C-level string methods instead of a
+        per-character loop.
         """
-        if not word:
-            return False
-
-        has_digit = False
-        for i, char in enumerate(word):
-            if char.isdigit():
-                has_digit = True
-            elif char == "-" and i == 0:
-                continue  # Allow leading minus
-            elif char == "." and has_digit:
-                continue  # Allow decimal point after digit
-            else:
-                return False
-
-        return has_digit
+        if word[:1] == "-":
+            word = word[1:]
+        # A leading digit puts every later point after a digit
+        return word[:1].isdigit() and word.replace(".", "").isdigit()
 
     def line_count(
         self,
         ignore_empty: bool = False,
         ignore_whitespace_only: bool = False,
+        compute_breakdown: bool = True,
     ) -> CountResult:
         """Count lines with filtering options.
 
-        Uses streaming approach for memory efficiency.
+        Splits on newlines in one C-level pass. The per-line length
+        breakdown is skipped when ``compute_breakdown`` is False.
         """
-        options: List[str] = []
-        breakdown: Dict[str, int] = {}
-        line_num = 0
-        total = 0
-
-        # Stream through text character by character
-        current_line: List[str] = []
-
-        for char in self._text:
-            if char == "\n":
-                line_num += 1
-                line_content = "".join(current_line)
-
-                # Apply filters
-                include = True
-                if ignore_whitespace_only:
-                    include = len(line_content.strip()) > 0
-                elif ignore_empty:
-                    include = len(line_content) > 0
-
-                if include:
-                    total += 1
-                    breakdown[f"line_{total}"] = len(line_content)
+        if not (compute_breakdown or ignore_empty or ignore_whitespace_only):
+            # Every newline ends a line; unterminated trailing text (or an
+            # empty text) forms one more. str.count scans in C, no copies.
+            text = self._text
+            return CountResult(
+                total=text.count("\n") + (0 if text.endswith("\n") else 1),
+                breakdown={},
+                text_length=len(text),
+            )
 
-                current_line = []
-            else:
-                current_line.append(char)
+        # Lines are the "\n"-separated pieces; a trailing newline does not
+        # open another line
+        lines = self._text.split("\n")
+        if self._text.endswith("\n"):
+            lines.pop()
 
-        # Handle last line (no trailing newline)
-        if current_line or not self._text.endswith("\n"):
-            line_content = "".join(current_line)
-            include = True
-            if ignore_whitespace_only:
-                include = len(line_content.strip()) > 0
-            elif ignore_empty:
-                include = len(line_content) > 0
+        if ignore_whitespace_only:
+            lines = [line for line in lines if line.strip()]
+        elif ignore_empty:
+            lines = [line for line in lines if line]
 
-            if include:
-                total += 1
-                breakdown[f"line_{total}"] = len(line_content)
+        options: List[str] = []
+        total = len(lines)
+        breakdown: Dict[str, int] = {}
+        if compute_breakdown:
+            breakdown = dict(
+                zip(map("line_{}".format, range(1, total + 1)), map(len, lines))
+            )
 
         if ignore_whitespace_only:
             options.append("ignore_whitespace_only")
@@ -737,104 +829,59 @@ class TextCounter:
             options_applied=options,
         )
 
-    def sentence_count(self) -> CountResult:
+    def sentence_count(self, compute_breakdown: bool = True) -> CountResult:
         """Count sentences using rule-based detection.
 
-        Uses state machine approach for accurate sentence boundary detection.
-        Handles abbreviations and edge cases better than simple regex.
+        A sentence is any text between runs of terminators (``.``, ``!``,
+        ``?``) that contains a non-whitespace character; repeated
+        terminators such as ``"!!"`` close a single sentence and trailing
+        text without a terminator still counts. Splitting is done by one
+        precompiled regex scan. Per-sentence word counts are skipped when
+        ``compute_breakdown`` is False.
         """
         breakdown: Dict[str, int] = {}
-        sentence_terminators = frozenset(".!?")
+        pieces = self._SENTENCE_SPLIT_PATTERN.split(self._text)
 
-        current_sentence: List[str] = []
-        sentence_num = 0
-        in_sentence = False
-
-        i = 0
-        while i < len(self._text):
-            char = self._text[i]
-
-            if char in sentence_terminators:
-                # Look ahead to handle multiple punctuation (e.g., "!!")
-                while (
-                    i + 1 < len(self._text)
-                    and self._text[i + 1] in sentence_terminators
-                ):
-                    i += 1
-
-                if in_sentence and current_sentence:
+        if compute_breakdown:
+            sentence_num = 0
+            for piece in pieces:
+                word_count = len(piece.split())
+                if word_count:
                     sentence_num += 1
-                    # Count words in sentence
-                    sentence_text = "".join(current_sentence).strip()
-                    word_count = len(sentence_text.split())
                     breakdown[f"sentence_{sentence_num}"] = word_count
-                    current_sentence = []
-                    in_sentence = False
-            else:
-                if not char.isspace() and not in_sentence:
-                    in_sentence = True
-                current_sentence.append(char)
-
-            i += 1
-
-        # Handle text without ending punctuation
-        if current_sentence:
-            remaining = "".join(current_sentence).strip()
-            if remaining:
-                sentence_num += 1
-                breakdown[f"sentence_{sentence_num}"] = len(remaining.split())
+        else:
+            sentence_num = sum(1 for piece in pieces if piece and not piece.isspace())
 
         return CountResult(
             total=sentence_num,
             breakdown=breakdown,
             text_length=len(self._text),
-            options_applied=[],
         )
 
-    def paragraph_count(self) -> CountResult:
+    def paragraph_count(self, compute_breakdown: bool = True) -> CountResult:
         """Count paragraphs using blank line detection.
 
         A paragraph is defined as text separated by one or more blank lines.
+        Splitting is done by one precompiled regex scan. Per-paragraph word
+        counts are skipped when ``compute_breakdown`` is False.
         """
         breakdown: Dict[str, int] = {}
-
-        current_paragraph: List[str] = []
-        paragraph_num = 0
-        consecutive_newlines = 0
-        in_paragraph = False
-
-        for char in self._text:
-            if char == "\n":
-                consecutive_newlines += 1
-
-                # Two or more newlines = paragraph break
-                if consecutive_newlines >= 2 and in_paragraph:
-                    para_text = "".join(current_paragraph).strip()
-                    if para_text:
-                        paragraph_num += 1
-                        breakdown[f"paragraph_{paragraph_num}"] = len(para_text.split())
-                    current_paragraph = []
-                    in_paragraph = False
-                else:
-                    current_paragraph.append(char)
-            else:
-                consecutive_newlines = 0
-                if not char.isspace():
-                    in_paragraph = True
-                current_paragraph.append(char)
-
-        # Handle last paragraph
-        if current_paragraph:
-            para_text = "".join(current_paragraph).strip()
-            if para_text:
-                paragraph_num += 1
-                breakdown[f"paragraph_{paragraph_num}"] = len(para_text.split())
+        pieces = self._PARAGRAPH_SPLIT_PATTERN.split(self._text)
+
+        if compute_breakdown:
+            paragraph_num = 0
+            for piece in pieces:
+                word_count = len(piece.split())
+                if word_count:
+                    paragraph_num += 1
+                    breakdown[f"paragraph_{paragraph_num}"] = word_count
+        else:
+            paragraph_num = sum(1 for piece in pieces if piece and not piece.isspace())
 
         return CountResult(
             total=paragraph_num,
             breakdown=breakdown,
             text_length=len(self._text),
-            options_applied=[],
         )
 
     @property
@@ -842,32 +889,49 @@ class TextCounter:
         """Cached summary of all counts.
 
         Custom caching implementation without functools.cached_property.
+        Counters over an equal text reuse a summary computed by another.
         """
         if self._summary_cache is None:
-            self._summary_cache = self._compute_summary()
+            text = self._text
+            if len(text) > self._SUMMARY_TEXT_MAX:
+                self._summary_cache = self._compute_summary()
+                return self._summary_cache
+            summaries = self._SUMMARIES
+            key = (len(text), hash(text))
+            entry = summaries.get(key)
+            if entry is not None and (entry[0] is text or entry[0] == text):
+                items = entry[1]
+            else:
+                items = tuple(self._compute_summary().items())
+                with self._SUMMARY_LOCK:
+                    if key not in summaries:
+                        if len(summaries) >= self._SUMMARY_CACHE_MAX:
+                            del summaries[next(iter(summaries))]
+                        summaries[key] = (text, items)
+            self._summary_cache = dict(items)
         return self._summary_cache
 
     def _compute_summary(self) -> Dict[str, int]:
-        """Compute full summary of counts."""
+        """Compute full summary of counts.
+
+        Works on the text directly rather than through the public count
+        methods, so no CountResult or filter set is built per figure and
+        the token lists are extracted once.
+        """
+        text = self._text
+        length = len(text)
         return {
-            "characters": self.char_count().total,
-            "characters_no_spaces": self.char_count(ignore_spaces=True).total,
-            "words": self.word_count().total,
-            "unique_words": self.word_count(
-                unique_only=True, case_sensitive=False
-            ).total,
-            "lines": self.line_count().total,
-            "sentences": self.sentence_count().total,
-            "paragraphs": self.paragraph_count().total,
+            "characters": length,
+            "characters_no_spaces": length - text.count(" "),
+            "words": len(self._get_words(True, True)),
+            "unique_words": len(set(self._get_words(False, True))),
+            "lines": text.count("\n") + (0 if text.endswith("\n") else 1),
+            "sentences": self.sentence_count(compute_breakdown=False).total,
+            "paragraphs": self.paragraph_count(compute_breakdown=False).total,
         }
 
     def get_summary(self) -> Dict[str, int]:
         """Get summary dict (method version for compatibility)."""
-        return {
-            "characters": self.char_count().total,
-            "characters_no_spaces": self.char_count(ignore_spaces=True).total,
-            "words": self.word_count().total,
-            "lines": self.line_count().total,
-            "sentences": self.sentence_count().total,
-            "paragraphs": self.paragraph_count().total,
-        }
+        summary = dict(self.summary)
+        del summary["unique_words"]
+        return summary
@@ -0,0 +1,66 @@
+"""Shared fixtures for the TextCounter test suite."""
+
+import json
+import random
+
+import pytest
+
+from textcounter.cli import compute, create_parser, main
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """CLI parser shared by tests that only parse arguments.
+
+    Parsing does not modify the parser, so one instance serves the session.
+    """
+    return create_parser()
+
+
+_SEED = 42
+
+
+@pytest.fixture
+def rng():
+    """Freshly seeded random generator, so generated inputs repeat every run.
+
+    Function-scoped: a shared generator would hand each test different draws
+    depending on which tests ran before it.
+    """
+    return random.Random(_SEED)
+
+
+@pytest.fixture(scope="session")
+def long_text():
+    """Ten thousand characters of letters and spaces, built once per session."""
+    return "".join(random.Random(_SEED).choices("abc ", k=10000))
+
+
+@pytest.fixture(scope="session")
+def cli_runner(parser):
+    """Run the CLI entry point with the shared parser."""
+
+    def run(argv):
+        return main(argv, parser=parser)
+
+    return run
+
+
+@pytest.fixture(scope="session")
+def cli_compute(parser):
+    """Compute CLI results as a dict with the shared parser, skipping output."""
+
+    def run(argv):
+        return compute(argv, parser=parser)
+
+    return run
+
+
+@pytest.fixture
+def json_out(capsys):
+    """Read the CLI's captured stdout and parse it as JSON."""
+
+    def read():
+        return json.loads(capsys.readouterr().out)
+
+    return read
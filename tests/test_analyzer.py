@@ -5,11 +5,15 @@ Tests cover frequency analysis, readability metrics, vocabulary richness,
 pattern extraction, and advanced NLP-lite features.
 """
 
+import re
+
 import pytest
 
-from textcounter import TextAnalyzer
+from textcounter import TextAnalyzer, TextCounter
 from textcounter.analyzer import FrequencyResult, ReadabilityResult, TextStatistics
 
+_EXPECTED_STR = re.compile(r"Expected str")
+
 
 class TestTextAnalyzerInit:
     """Tests for TextAnalyzer initialization."""
@@ -31,7 +35,7 @@ class TestTextAnalyzerInit:
 
     def test_init_invalid_type_raises(self):
         """Non-string input raises TypeError."""
-        with pytest.raises(TypeError, match="Expected str"):
+        with pytest.raises(TypeError, match=_EXPECTED_STR):
             TextAnalyzer(123)
 
     def test_text_setter(self):
@@ -40,6 +44,33 @@ class TestTextAnalyzerInit:
         analyzer.text = "Changed"
         assert analyzer.text == "Changed"
 
+    def test_init_with_shared_counter(self):
+        """An existing TextCounter over the same text is reused."""
+        counter = TextCounter("Hello World")
+        analyzer = TextAnalyzer("Hello World", counter=counter)
+        assert analyzer.readability().avg_word_length == 5.0
+        analyzer.text = "Changed text"
+        assert counter.text == "Changed text"
+
+    def test_analyzers_sharing_counter_see_same_text(self):
+        """Analyzers over one counter follow text changes made by either."""
+        counter = TextCounter("one two")
+        first = TextAnalyzer("one two", counter=counter)
+        second = TextAnalyzer("one two", counter=counter)
+        assert second.statistics.word_count == 2
+        first.text = "three four five six"
+        assert second.text == "three four five six"
+        stats = second.statistics
+        assert (stats.word_count, stats.char_count) == (4, 19)
+        counter.text = "seven"
+        assert first.readability().avg_word_length == 5.0
+        assert first.statistics.word_count == 1
+
+    def test_init_with_mismatched_counter_raises(self):
+        """A counter over different text is rejected."""
+        with pytest.raises(ValueError, match="same text"):
+            TextAnalyzer("Hello", counter=TextCounter("World"))
+
 
 class TestFrequencyResultDataclass:
     """Tests for FrequencyResult container."""
@@ -88,7 +119,7 @@ class TestFrequencyResultDataclass:
         assert result.top(2) == [("a", 5), ("b", 3)]
 
     def test_percentages_calculated(self):
-        """Percentages are calculated on init."""
+        """Percentages are calculated on first access."""
         result = FrequencyResult(
             frequencies={"a": 2, "b": 2},
             total_items=4,
@@ -96,6 +127,28 @@ class TestFrequencyResultDataclass:
             most_common=[("a", 2), ("b", 2)],
         )
         assert result.percentages["a"] == 50.0
+        assert dict(result.percentages) == {"a": 50.0, "b": 50.0}
+
+    def test_percentages_empty(self):
+        """Percentages are empty when there are no items."""
+        result = FrequencyResult(
+            frequencies={}, total_items=0, unique_items=0, most_common=[]
+        )
+        assert dict(result.percentages) == {}
+
+    def test_views_are_read_only(self):
+        """Properties expose read-only views rather than copies."""
+        result = FrequencyResult(
+            frequencies={"a": 1},
+            total_items=1,
+            unique_items=1,
+            most_common=[("a", 1)],
+        )
+        assert result.most_common == (("a", 1),)
+        with pytest.raises(TypeError):
+            result.frequencies["a"] = 2  # type: ignore[index]
+        with pytest.raises(TypeError):
+            result.percentages["a"] = 0.0  # type: ignore[index]
 
 
 class TestCharacterFrequency:
@@ -160,6 +213,21 @@ class TestWordFrequency:
         assert "and" not in result.frequencies
         assert "cat" in result.frequencies
 
+    def test_ties_sorted_alphabetically(self):
+        """Equal frequencies are ranked alphabetically, with or without top_n."""
+        analyzer = TextAnalyzer("pear apple fig apple pear fig kiwi")
+        expected = [("apple", 2), ("fig", 2), ("pear", 2), ("kiwi", 1)]
+        assert analyzer.word_frequency().top(4) == expected
+        assert analyzer.word_frequency(top_n=2).top(4) == expected[:2]
+
+    @pytest.mark.parametrize("top_n", [0, -1, -3])
+    def test_non_positive_top_n_slices_ranking(self, top_n):
+        """top_n of 0 keeps everything; a negative one drops from the end."""
+        analyzer = TextAnalyzer("a a b c c c d")
+        ranked = [("c", 3), ("a", 2), ("b", 1), ("d", 1)]
+        expected = ranked[:top_n] if top_n else ranked
+        assert list(analyzer.word_frequency(top_n=top_n).most_common) == expected
+
 
 class TestNgramAnalysis:
     """Tests for n-gram analysis."""
@@ -188,6 +256,12 @@ class TestNgramAnalysis:
         result = analyzer.ngrams(n=2)
         assert result.total_items == 0
 
+    @pytest.mark.parametrize("n", [0, -1])
+    def test_non_positive_n_raises(self, n):
+        """n below 1 is rejected."""
+        with pytest.raises(ValueError, match="at least 1"):
+            TextAnalyzer("the quick brown fox").ngrams(n=n)
+
 
 class TestReadability:
     """Tests for readability analysis."""
@@ -225,6 +299,15 @@ class TestReadability:
         result = analyzer.readability()
         assert result.flesch_reading_ease < 70
 
+    def test_word_length_measured_lowercased(self):
+        """Word lengths count the lowercased word, which can be longer."""
+        analyzer = TextAnalyzer("İİİ is big. ΑΣ ok.")
+        assert analyzer.readability().avg_word_length == 3.0
+        assert analyzer.statistics.avg_word_length == 3.0
+        other = TextAnalyzer("İİİ is big. ΑΣ ok.")
+        comparison = TextAnalyzer("").compare(other)
+        assert comparison["avg_word_length"]["text2"] == 3.0
+
     def test_is_easy_property(self):
         """is_easy property works."""
         analyzer = TextAnalyzer("The cat sat.")
@@ -243,6 +326,15 @@ class TestReadability:
             "Graduate/Professional",
         ]
 
+    def test_syllable_cache_shared_by_case_variants(self):
+        """Case variants of a word share one syllable cache entry."""
+        estimate = TextAnalyzer._estimate_syllables
+        estimate.cache_clear()
+        analyzer = TextAnalyzer()
+        counts = {analyzer._count_syllables(w) for w in ("Table", "TABLE", "table")}
+        assert len(counts) == 1
+        assert estimate.cache_info().currsize == 1
+
 
 class TestVocabularyRichness:
     """Tests for vocabulary richness metrics."""
@@ -290,6 +382,13 @@ class TestDistributions:
         dist = analyzer.sentence_length_distribution()
         assert 1 in dist or 2 in dist
 
+    def test_cache_invalidated_on_text_change(self):
+        """Cached tokens are discarded when the text is replaced."""
+        analyzer = TextAnalyzer("a to the hello")
+        assert analyzer.word_length_distribution() == {1: 1, 2: 1, 3: 1, 5: 1}
+        analyzer.text = "hi there"
+        assert analyzer.word_length_distribution() == {2: 1, 5: 1}
+
 
 class TestStatistics:
     """Tests for comprehensive statistics."""
@@ -308,6 +407,15 @@ class TestStatistics:
         stats = analyzer.statistics
         assert isinstance(stats, TextStatistics)
 
+    def test_statistics_shared_until_text_changes(self):
+        """Statistics are computed once per text."""
+        analyzer = TextAnalyzer("Hello world!")
+        stats = analyzer.get_statistics()
+        assert analyzer.statistics is stats
+        analyzer.text = "Goodbye cruel world!"
+        assert analyzer.get_statistics() is not stats
+        assert analyzer.statistics.word_count == 3
+
     def test_statistics_to_dict(self):
         """Statistics can be serialized."""
         analyzer = TextAnalyzer("Hello world!")
@@ -331,6 +439,13 @@ class TestPatternExtraction:
         matches = analyzer.find_patterns(r"cat", case_sensitive=False)
         assert len(matches) == 2
 
+    def test_find_patterns_cached_per_flags(self):
+        """Cached patterns still honour case sensitivity per call."""
+        analyzer = TextAnalyzer("Cat cat CAT")
+        assert len(analyzer.find_patterns(r"cat")) == 3
+        assert analyzer.find_patterns(r"cat", case_sensitive=True) == [(4, 7, "cat")]
+        assert len(analyzer.find_patterns(r"cat")) == 3
+
     def test_extract_emails(self):
         """Email extraction."""
         analyzer = TextAnalyzer("Contact test@example.com or info@site.org")
@@ -345,6 +460,11 @@ class TestPatternExtraction:
         assert len(urls) == 1
         assert "https://example.com" in urls[0]
 
+    def test_extract_urls_strips_trailing_punctuation(self):
+        """Sentence punctuation after a URL is not part of it."""
+        analyzer = TextAnalyzer("See (https://example.com/a).")
+        assert analyzer.extract_urls() == ["https://example.com/a"]
+
     def test_extract_numbers(self):
         """Number extraction."""
         analyzer = TextAnalyzer("Price: $19.99 for 3 items")
@@ -365,6 +485,54 @@ class TestComparison:
         assert comparison["word_count"]["text1"] == 2
         assert comparison["word_count"]["text2"] == 3
 
+    def test_compare_matches_statistics(self):
+        """Comparison metrics agree with full statistics."""
+        a1 = TextAnalyzer("The cat sat. The cat ran away!")
+        a2 = TextAnalyzer("Dogs bark loudly at night")
+        comparison = a1.compare(a2)
+        assert a1.get_statistics() is not None  # warm one side's cache
+        assert a1.compare(a2) == comparison
+        for key in ("word_count", "char_count", "avg_word_length"):
+            assert comparison[key]["text1"] == getattr(a1.statistics, key)
+            assert comparison[key]["text2"] == getattr(a2.statistics, key)
+        assert (
+            comparison["vocabulary_richness"]["text1"]
+            == a1.statistics.vocabulary_richness
+        )
+
+    @pytest.mark.slow
+    def test_compare_many_matches_compare(self):
+        """compare_many returns one compare() result per text, in order."""
+        base = TextAnalyzer("The cat sat on the mat.")
+        others = [
+            TextAnalyzer("Hello world"),
+            TextAnalyzer(""),
+            TextAnalyzer("A much longer sentence with many more words in it."),
+        ]
+        expected = [base.compare(other) for other in others]
+        assert base.compare_many(others) == expected
+        assert base.compare_many(others, processes=2) == expected
+        assert others[0].statistics.word_count == 2
+        assert base.compare_many(others, processes=2) == expected
+
+    @pytest.mark.parametrize("processes", [1, 0])
+    def test_compare_many_single_worker_skips_pool(self, monkeypatch, processes):
+        """One worker or fewer compares in this process."""
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("worker pool started")
+
+        monkeypatch.setattr("multiprocessing.Pool", no_pool)
+        base = TextAnalyzer("The cat sat.")
+        others = [TextAnalyzer("Hello world"), TextAnalyzer("Goodbye")]
+        assert base.compare_many(others, processes=processes) == [
+            base.compare(other) for other in others
+        ]
+
+    def test_compare_many_empty(self):
+        """No texts to compare yields no results."""
+        assert TextAnalyzer("Hello").compare_many([]) == []
+
 
 class TestDunderMethods:
     """Tests for dunder methods."""
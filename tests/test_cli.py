@@ -6,12 +6,12 @@ filtering options, and error handling.
 """
 
 import json
-import os
-import tempfile
+import subprocess
+import sys
 
 import pytest
 
-from textcounter.cli import create_parser, main
+from textcounter.cli import create_parser
 
 
 class TestArgumentParsing:
@@ -29,78 +29,111 @@ class TestArgumentParsing:
             parser.parse_args(["--version"])
         assert exc_info.value.code == 0
 
-    def test_chars_flag(self):
+    @pytest.mark.slow
+    def test_import_defers_counting_modules(self):
+        """Importing the CLI does not load the counting modules."""
+        code = (
+            "import sys, textcounter.cli; "
+            "print(any(m in sys.modules for m in "
+            "('textcounter.counter', 'textcounter.analyzer')))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "False"
+
+    @pytest.mark.slow
+    def test_counting_skips_analyzer(self):
+        """Counting-only runs do not load the analyzer module."""
+        code = (
+            "import sys; from textcounter.cli import main; "
+            "main(['-a', '-t', 'Hello world.']); "
+            "print('textcounter.analyzer' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip().splitlines()[-1] == "False"
+
+    def test_chars_flag(self, parser):
         """--chars flag is recognized."""
-        parser = create_parser()
         args = parser.parse_args(["--chars", "-t", "test"])
         assert args.chars is True
 
-    def test_words_flag(self):
+    def test_words_flag(self, parser):
         """--words flag is recognized."""
-        parser = create_parser()
         args = parser.parse_args(["--words", "-t", "test"])
         assert args.words is True
 
-    def test_text_input(self):
+    def test_text_input(self, parser):
         """--text / -t accepts input."""
-        parser = create_parser()
         args = parser.parse_args(["-t", "Hello World"])
         assert args.text == "Hello World"
 
+    @pytest.mark.parametrize("n", ["0", "-2"])
+    def test_ngrams_below_one_rejected(self, parser, capsys, n):
+        """--ngrams needs a size of at least 1."""
+        with pytest.raises(SystemExit) as exc_info:
+            parser.parse_args(["--ngrams", n, "-t", "test"])
+        assert exc_info.value.code == 2
+        assert "must be at least 1" in capsys.readouterr().err
+
 
 class TestBasicCounting:
     """Tests for basic counting commands."""
 
-    def test_character_count(self, capsys):
+    def test_character_count(self, cli_runner, capsys):
         """Character counting works."""
-        exit_code = main(["-t", "Hello World", "-c"])
-        captured = capsys.readouterr()
+        exit_code = cli_runner(["-t", "Hello World", "-c"])
         assert exit_code == 0
-        assert "11" in captured.out or "characters" in captured.out
-
-    def test_word_count(self, capsys):
-        """Word counting works."""
-        exit_code = main(["-t", "Hello World", "-w", "--json"])
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
-        assert data["words"] == 2
-
-    def test_line_count(self, capsys):
-        """Line counting works."""
-        exit_code = main(["-t", "Hello\nWorld", "-l", "--json"])
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
-        assert data["lines"] == 2
-
-    def test_sentence_count(self, capsys):
-        """Sentence counting works."""
-        exit_code = main(["-t", "Hello! How are you?", "-s", "--json"])
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
-        assert data["sentences"] == 2
-
-    def test_all_counts(self, capsys):
+        assert capsys.readouterr().out == "characters: 11\n"
+
+    @pytest.mark.parametrize(
+        "argv, key, expected",
+        [
+            (["-t", "Hello World", "-w"], "words", 2),
+            (["-t", "Hello\nWorld", "-l"], "lines", 2),
+            (["-t", "Hello! How are you?", "-s"], "sentences", 2),
+        ],
+        ids=["words", "lines", "sentences"],
+    )
+    def test_json_count(self, cli_compute, argv, key, expected):
+        """Each counting flag reports its total."""
+        assert cli_compute(argv)[key] == expected
+
+    def test_all_counts(self, cli_runner, capsys):
         """--all shows all counts."""
-        exit_code = main(["-t", "Hello World!", "-a"])
-        captured = capsys.readouterr()
+        exit_code = cli_runner(["-t", "Hello World!", "-a"])
         assert exit_code == 0
-        assert "words" in captured.out.lower() or "2" in captured.out
+        assert capsys.readouterr().out.splitlines() == [
+            "characters: 12",
+            "words: 2",
+            "lines: 1",
+            "sentences: 1",
+            "paragraphs: 1",
+        ]
 
 
 class TestOutputFormats:
     """Tests for output format options."""
 
-    def test_json_output(self, capsys):
+    def test_json_output(self, cli_runner, json_out):
         """--json produces valid JSON."""
-        exit_code = main(["-t", "Hello World", "--json", "-c"])
-        captured = capsys.readouterr()
+        exit_code = cli_runner(["-t", "Hello World", "--json", "-c"])
+        data = json_out()
         assert exit_code == 0
-        data = json.loads(captured.out)
         assert "characters" in data
 
-    def test_quiet_mode(self, capsys):
+    def test_compute_matches_json(self, cli_runner, cli_compute, json_out):
+        """compute() returns what --json prints."""
+        argv = ["-t", "The cat sat. The cat ran.", "-a", "--stats", "--ngrams", "2"]
+        exit_code = cli_runner([*argv, "--json"])
+        assert exit_code == 0
+        assert json_out() == json.loads(json.dumps(cli_compute(argv)))
+
+    def test_quiet_mode(self, cli_runner, capsys):
         """--quiet shows only numbers."""
-        exit_code = main(["-t", "Hello World", "-w", "--quiet"])
+        exit_code = cli_runner(["-t", "Hello World", "-w", "--quiet"])
         captured = capsys.readouterr()
         assert exit_code == 0
         assert captured.out.strip() == "2"
@@ -109,103 +142,56 @@ class TestOutputFormats:
 class TestFilteringOptions:
     """Tests for filtering options."""
 
-    def test_no_spaces(self, capsys):
-        """--no-spaces excludes spaces."""
-        exit_code = main(["-t", "Hello World", "-c", "--no-spaces", "--json"])
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
-        assert data["characters"] == 10
-
-    def test_no_punctuation(self, capsys):
-        """--no-punctuation excludes punctuation."""
-        exit_code = main(["-t", "Hello, World!", "-c", "--no-punctuation", "--json"])
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
-        assert data["characters"] == 11
-
-    def test_no_digits(self, capsys):
-        """--no-digits excludes digits."""
-        exit_code = main(["-t", "Hello123", "-c", "--no-digits", "--json"])
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
-        assert data["characters"] == 5
-
-    def test_unique_words(self, capsys):
-        """--unique counts unique words."""
-        exit_code = main(["-t", "hello world hello", "-w", "--unique", "--json"])
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
-        assert data["words"] == 2
-
-    def test_min_length(self, capsys):
-        """--min-length filters by word length."""
-        exit_code = main(
-            ["-t", "I am a developer", "-w", "--min-length", "3", "--json"]
-        )
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
-        assert data["words"] == 1  # Only "developer"
+    @pytest.mark.parametrize(
+        "argv, key, expected",
+        [
+            (["-t", "Hello World", "-c", "--no-spaces"], "characters", 10),
+            (["-t", "Hello, World!", "-c", "--no-punctuation"], "characters", 11),
+            (["-t", "Hello123", "-c", "--no-digits"], "characters", 5),
+            (["-t", "hello world hello", "-w", "--unique"], "words", 2),
+            # Only "developer" is at least three characters long
+            (["-t", "I am a developer", "-w", "--min-length", "3"], "words", 1),
+        ],
+        ids=["no-spaces", "no-punctuation", "no-digits", "unique", "min-length"],
+    )
+    def test_filtered_count(self, cli_compute, argv, key, expected):
+        """Filtering options narrow what is counted."""
+        assert cli_compute(argv)[key] == expected
 
 
 class TestAnalysisCommands:
     """Tests for analysis commands."""
 
-    def test_char_frequency(self, capsys):
-        """--frequency chars works."""
-        exit_code = main(["-t", "hello", "--frequency", "chars", "--json"])
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
-        assert "frequency" in data
-
-    def test_word_frequency(self, capsys):
-        """--frequency words works."""
-        exit_code = main(["-t", "hello world hello", "--frequency", "words", "--json"])
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
-        assert "frequency" in data
-
-    def test_readability(self, capsys):
-        """--readability works."""
-        exit_code = main(["-t", "The cat sat on the mat.", "--readability", "--json"])
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
-        assert "readability" in data
-
-    def test_ngrams(self, capsys):
-        """--ngrams works."""
-        exit_code = main(["-t", "the quick brown fox", "--ngrams", "2", "--json"])
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
-        assert "ngrams" in data
-
-    def test_statistics(self, capsys):
-        """--stats works."""
-        exit_code = main(["-t", "Hello World!", "--stats", "--json"])
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
-        assert "statistics" in data
+    @pytest.mark.parametrize(
+        "argv, key",
+        [
+            (["-t", "hello", "--frequency", "chars"], "frequency"),
+            (["-t", "hello world hello", "--frequency", "words"], "frequency"),
+            (["-t", "The cat sat on the mat.", "--readability"], "readability"),
+            (["-t", "the quick brown fox", "--ngrams", "2"], "ngrams"),
+            (["-t", "Hello World!", "--stats"], "statistics"),
+        ],
+        ids=["char-frequency", "word-frequency", "readability", "ngrams", "stats"],
+    )
+    def test_analysis_section(self, cli_compute, argv, key):
+        """Each analysis command adds its section to the results."""
+        assert key in cli_compute(argv)
 
 
 class TestFileInput:
     """Tests for file input handling."""
 
-    def test_read_from_file(self, capsys):
+    def test_read_from_file(self, cli_compute, tmp_path):
         """Reading from file works."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("Hello World")
-            f.flush()
-            temp_path = f.name
-
-        try:
-            exit_code = main([temp_path, "-c", "--json"])
-            captured = capsys.readouterr()
-            data = json.loads(captured.out)
-            assert exit_code == 0
-            assert data["characters"] == 11
-        finally:
-            os.unlink(temp_path)
-
-    def test_file_not_found(self):
-        """Missing file raises error."""
-        with pytest.raises(SystemExit):
-            main(["nonexistent_file_12345.txt", "-c"])
+        path = tmp_path / "input.txt"
+        path.write_text("Hello World")
+
+        assert cli_compute([str(path), "-c"])["characters"] == 11
+
+    def test_file_not_found(self, cli_runner, tmp_path, capsys):
+        """Missing file exits with status 1 and names the file."""
+        path = tmp_path / "nonexistent_file_12345.txt"
+        with pytest.raises(SystemExit) as exc_info:
+            cli_runner([str(path), "-c"])
+        assert exc_info.value.code == 1
+        assert str(path) in capsys.readouterr().err
@@ -5,11 +5,53 @@ Tests cover all functionality including edge cases, performance characteristics,
 and Pythonic interface behaviors (iterator protocol, context management, etc.).
 """
 
+import operator
+import re
+import string
+from collections import Counter
+from functools import lru_cache
+
 import pytest
 
 from textcounter import TextCounter
 from textcounter.counter import CountResult
 
+_EXPECTED_STR = re.compile(r"Expected str")
+
+
+@pytest.fixture(scope="module")
+def counter_for():
+    """Return the module's shared read-only counter for a given text.
+
+    Parametrized cases over the same text reuse one instance instead of
+    each constructing their own.
+    """
+    return lru_cache(maxsize=None)(TextCounter)
+
+
+@pytest.fixture(scope="module")
+def tc_hello():
+    """Shared read-only counter over ``"Hello"``."""
+    return TextCounter("Hello")
+
+
+@pytest.fixture(scope="module")
+def tc_hello_world():
+    """Shared read-only counter over ``"Hello World"``."""
+    return TextCounter("Hello World")
+
+
+@pytest.fixture(scope="module")
+def result_aab():
+    """Default character count of ``"aab"``, shared by read-only tests."""
+    return TextCounter("aab").char_count()
+
+
+@pytest.fixture(scope="module")
+def tc_long(long_text):
+    """Shared read-only counter over the session's ``long_text``."""
+    return TextCounter(long_text)
+
 
 class TestCountResultDataclass:
     """Tests for the CountResult container class."""
@@ -19,31 +61,32 @@ class TestCountResultDataclass:
         result = CountResult(total=42, breakdown={"a": 42})
         assert int(result) == 42
 
-    def test_addition_with_int(self):
-        """CountResult supports addition with integers."""
-        result = CountResult(total=10)
-        assert result + 5 == 15
-        assert 5 + result == 15
-
-    def test_addition_with_count_result(self):
-        """CountResult supports addition with other CountResults."""
-        r1 = CountResult(total=10)
-        r2 = CountResult(total=20)
-        assert r1 + r2 == 30
-
-    def test_equality_with_int(self):
-        """CountResult can be compared to integers."""
-        result = CountResult(total=10)
-        assert result == 10
-        assert result != 11
-
-    def test_comparison_operators(self):
-        """CountResult supports comparison operators."""
-        r1 = CountResult(total=10)
-        r2 = CountResult(total=20)
-        assert r1 < r2
-        assert r1 < 15
-        assert not (r1 < 5)
+    @pytest.mark.parametrize(
+        "a, op, b, expected",
+        [
+            (CountResult(total=10), operator.add, 5, 15),
+            (5, operator.add, CountResult(total=10), 15),
+            (CountResult(total=10), operator.add, CountResult(total=20), 30),
+            (CountResult(total=10), operator.eq, 10, True),
+            (CountResult(total=10), operator.ne, 11, True),
+            (CountResult(total=10), operator.lt, CountResult(total=20), True),
+            (CountResult(total=10), operator.lt, 15, True),
+            (CountResult(total=10), operator.lt, 5, False),
+        ],
+        ids=[
+            "add-int",
+            "radd-int",
+            "add-result",
+            "eq-int",
+            "ne-int",
+            "lt-result",
+            "lt-int",
+            "not-lt-int",
+        ],
+    )
+    def test_operators(self, a, op, b, expected):
+        """CountResult supports arithmetic and comparison with ints and results."""
+        assert op(a, b) == expected
 
     def test_to_dict(self):
         """CountResult can be serialized to dictionary."""
@@ -52,14 +95,42 @@ class TestCountResultDataclass:
         assert d["total"] == 5
         assert d["breakdown"] == {"a": 3, "b": 2}
 
+    def test_most_common(self):
+        """most_common ranks by count, ties alphabetically, and honours n."""
+        result = CountResult(total=6, breakdown={"c": 1, "b": 2, "a": 2, "d": 1})
+        assert result.most_common() == [("a", 2), ("b", 2), ("c", 1), ("d", 1)]
+        assert result.most_common(3) == [("a", 2), ("b", 2), ("c", 1)]
+        assert result.most_common(0) == []
+
+    def test_ranking_reused_across_calls(self):
+        """Repeated iteration and most_common agree and are not aliased."""
+        result = CountResult(total=6, breakdown={"c": 1, "b": 2, "a": 2, "d": 1})
+        first = list(result)
+        ranked = result.most_common()
+        ranked.clear()
+        assert list(result) == first
+        assert result.most_common() == first
+        assert result.most_common(2) == first[:2]
+
+    def test_options_not_aliased(self):
+        """Mutating the options list passed in does not change the result."""
+        options = ["ignore_spaces"]
+        result = CountResult(total=1, options_applied=options)
+        hash_before = hash(result)
+        options.append("ignore_digits")
+        assert result.options_applied == ["ignore_spaces"]
+        assert result.to_dict()["options_applied"] == ["ignore_spaces"]
+        assert hash(CountResult(total=1, options_applied=["ignore_spaces"])) == (
+            hash_before
+        )
+
 
 class TestTextCounterInit:
     """Tests for TextCounter initialization and properties."""
 
-    def test_init_with_string(self):
+    def test_init_with_string(self, tc_hello_world):
         """Initialize with valid string."""
-        tc = TextCounter("Hello World")
-        assert tc.text == "Hello World"
+        assert tc_hello_world.text == "Hello World"
 
     def test_init_with_empty_string(self):
         """Initialize with empty string."""
@@ -72,12 +143,19 @@ class TestTextCounterInit:
         tc = TextCounter()
         assert tc.text == ""
 
-    def test_init_invalid_type_raises(self):
-        """Non-string input raises TypeError."""
-        with pytest.raises(TypeError, match="Expected str"):
-            TextCounter(123)
-        with pytest.raises(TypeError):
-            TextCounter(["list"])
+    @pytest.mark.parametrize(
+        "action",
+        [
+            lambda: TextCounter(123),
+            lambda: TextCounter(["list"]),
+            lambda: setattr(TextCounter("Initial"), "text", 123),
+        ],
+        ids=["init_int", "init_list", "setter_int"],
+    )
+    def test_invalid_type_raises(self, action):
+        """Non-string text raises TypeError, at init or through the setter."""
+        with pytest.raises(TypeError, match=_EXPECTED_STR):
+            action()
 
     def test_text_setter(self):
         """Text property can be updated."""
@@ -85,46 +163,54 @@ class TestTextCounterInit:
         tc.text = "Changed"
         assert tc.text == "Changed"
 
-    def test_text_setter_invalid_type(self):
-        """Setting non-string text raises TypeError."""
-        tc = TextCounter("Initial")
-        with pytest.raises(TypeError):
-            tc.text = 123
+    def test_text_setter_resets_word_cache(self):
+        """Cached tokens are discarded when the text is replaced."""
+        tc = TextCounter("one two")
+        assert tc.word_count().total == 2
+        tc.text = "one two three"
+        assert tc.word_count().total == 3
+
+    def test_text_setter_resets_lowercase_cache(self):
+        """Case-insensitive counts follow the new text."""
+        tc = TextCounter("Ünï")
+        assert tc.char_count(case_sensitive=False, count_only="ü").total == 1
+        tc.text = "Ab ab"
+        assert tc.char_count(case_sensitive=False, count_only="ü").total == 0
+        assert tc.word_count(case_sensitive=False, unique_only=True).total == 1
 
 
 class TestTextCounterProtocols:
     """Tests for Python protocol implementations."""
 
-    def test_len_protocol(self):
-        """__len__ returns text length."""
-        tc = TextCounter("Hello")
-        assert len(tc) == 5
-
-    def test_bool_protocol(self):
-        """__bool__ returns True for non-empty text."""
-        assert bool(TextCounter("Hello"))
-        assert not bool(TextCounter(""))
+    @pytest.mark.parametrize(
+        "text, expected_len",
+        [("Hello", 5), ("", 0), ("Hello World", 11)],
+        ids=["word", "empty", "two_words"],
+    )
+    def test_len_and_bool_protocols(self, text, expected_len):
+        """__len__ returns text length and __bool__ is False only when empty."""
+        tc = TextCounter(text)
+        assert len(tc) == expected_len
+        assert bool(tc) is (expected_len > 0)
 
     def test_iter_protocol(self):
         """__iter__ yields characters."""
         tc = TextCounter("ABC")
         assert list(tc) == ["A", "B", "C"]
 
-    def test_repr(self):
+    def test_repr(self, tc_hello):
         """__repr__ shows preview and length."""
-        tc = TextCounter("Hello")
-        assert "Hello" in repr(tc)
-        assert "len=5" in repr(tc)
+        assert "Hello" in repr(tc_hello)
+        assert "len=5" in repr(tc_hello)
 
-    def test_repr_truncates_long_text(self):
+    def test_repr_truncates_long_text(self, tc_long):
         """Long text is truncated in repr."""
-        tc = TextCounter("a" * 100)
-        assert "..." in repr(tc)
+        assert "..." in repr(tc_long)
+        assert f"len={len(tc_long)}" in repr(tc_long)
 
-    def test_str(self):
+    def test_str(self, tc_hello_world):
         """__str__ provides human-readable summary."""
-        tc = TextCounter("Hello World")
-        s = str(tc)
+        s = str(tc_hello_world)
         assert "11 chars" in s
         assert "2 words" in s
 
@@ -137,134 +223,105 @@ class TestTextCounterProtocols:
 class TestCharacterCounting:
     """Tests for char_count method."""
 
-    def test_basic_count(self):
-        """Basic character count."""
-        tc = TextCounter("Hello")
-        assert tc.char_count().total == 5
-
-    def test_with_spaces(self):
-        """Count includes spaces by default."""
-        tc = TextCounter("Hello World")
-        assert tc.char_count().total == 11
-
-    def test_ignore_spaces(self):
-        """ignore_spaces excludes space characters."""
-        tc = TextCounter("Hello World")
-        result = tc.char_count(ignore_spaces=True)
-        assert result.total == 10
+    @pytest.mark.parametrize(
+        "text, kwargs, expected",
+        [
+            ("Hello", {}, 5),
+            ("Hello World", {}, 11),
+            ("Hello World", {"ignore_spaces": True}, 10),
+            ("Hello, World!", {"ignore_punctuation": True}, 11),
+            ("Hello123", {"ignore_digits": True}, 5),
+            ("Hello\nWorld", {"ignore_newlines": True}, 10),
+            # "Hello World" without 'l' and 'o' = "He Wrd" = 6 characters
+            ("Hello World", {"custom_ignore": "lo"}, 6),
+            ("Hello World", {"count_only": "aeiou"}, 3),  # e, o, o
+            (
+                "Hello, World! 123",
+                {
+                    "ignore_spaces": True,
+                    "ignore_punctuation": True,
+                    "ignore_digits": True,
+                },
+                10,
+            ),
+            ("", {}, 0),
+        ],
+        ids=[
+            "basic",
+            "with_spaces",
+            "ignore_spaces",
+            "ignore_punctuation",
+            "ignore_digits",
+            "ignore_newlines",
+            "custom_ignore",
+            "count_only",
+            "multiple_options",
+            "empty_string",
+        ],
+    )
+    def test_option_totals(self, counter_for, text, kwargs, expected):
+        """Each filtering option yields the expected character total."""
+        assert counter_for(text).char_count(**kwargs).total == expected
+
+    def test_options_applied(self, tc_hello_world):
+        """Applied options are recorded on the result."""
+        result = tc_hello_world.char_count(ignore_spaces=True)
         assert "ignore_spaces" in result.options_applied
 
-    def test_ignore_punctuation(self):
-        """ignore_punctuation excludes punctuation marks."""
-        tc = TextCounter("Hello, World!")
-        result = tc.char_count(ignore_punctuation=True)
-        assert result.total == 11
-
-    def test_ignore_digits(self):
-        """ignore_digits excludes numeric characters."""
-        tc = TextCounter("Hello123")
-        result = tc.char_count(ignore_digits=True)
-        assert result.total == 5
-
-    def test_ignore_newlines(self):
-        """ignore_newlines excludes newline characters."""
-        tc = TextCounter("Hello\nWorld")
-        result = tc.char_count(ignore_newlines=True)
-        assert result.total == 10
-
-    def test_case_insensitive(self):
+    def test_case_insensitive(self, tc_hello):
         """case_sensitive=False normalizes to lowercase."""
-        tc = TextCounter("Hello")
-        result = tc.char_count(case_sensitive=False)
+        result = tc_hello.char_count(case_sensitive=False)
         assert "h" in result.breakdown
         assert "H" not in result.breakdown
 
-    def test_custom_ignore(self):
-        """custom_ignore excludes specified characters."""
-        tc = TextCounter("Hello World")
-        result = tc.char_count(custom_ignore="lo")
-        # "Hello World" without 'l' and 'o' = "He Wrd" = 6 characters
-        assert result.total == 6
-
-    def test_count_only(self):
-        """count_only restricts to specific characters."""
-        tc = TextCounter("Hello World")
-        result = tc.char_count(count_only="aeiou")
-        assert result.total == 3  # e, o, o
-
-    def test_multiple_options(self):
-        """Multiple filtering options work together."""
-        tc = TextCounter("Hello, World! 123")
-        result = tc.char_count(
-            ignore_spaces=True, ignore_punctuation=True, ignore_digits=True
-        )
-        assert result.total == 10
+    def test_case_insensitive_final_sigma(self):
+        """Case folding follows str.lower, including word-final sigma."""
+        text = "ΟΔΟΣ ΣΑΣ"
+        result = TextCounter(text).char_count(case_sensitive=False)
+        assert result.breakdown == dict(Counter(text.lower()))
+        words = TextCounter(text).word_count(case_sensitive=False)
+        assert words.breakdown == {"οδος": 1, "σας": 1}
 
-    def test_empty_string(self):
-        """Empty string returns zero count."""
-        tc = TextCounter("")
-        assert tc.char_count().total == 0
+    def test_breakdown_total(self, result_aab):
+        """Total counts every character in the breakdown."""
+        assert result_aab.total == 3
 
-    def test_breakdown_frequencies(self):
+    def test_breakdown_frequencies(self, result_aab):
         """Breakdown contains correct frequencies."""
-        tc = TextCounter("aab")
-        result = tc.char_count()
-        assert result.breakdown == {"a": 2, "b": 1}
+        assert result_aab.breakdown == {"a": 2, "b": 1}
 
 
 class TestWordCounting:
     """Tests for word_count method."""
 
-    def test_basic_count(self):
-        """Basic word count."""
-        tc = TextCounter("Hello World")
-        assert tc.word_count().total == 2
-
-    def test_strips_punctuation_by_default(self):
-        """Punctuation stripped by default."""
-        tc = TextCounter("Hello, World!")
-        assert tc.word_count().total == 2
-
-    def test_ignore_numbers(self):
-        """ignore_numbers excludes numeric-only tokens."""
-        tc = TextCounter("Hello 123 World")
-        result = tc.word_count(ignore_numbers=True)
-        assert result.total == 2
-
-    def test_min_length_filter(self):
-        """min_length filters short words."""
-        tc = TextCounter("I am a developer")
-        result = tc.word_count(min_length=2)
-        assert result.total == 2  # "am" and "developer"
-
-    def test_max_length_filter(self):
-        """max_length filters long words."""
-        tc = TextCounter("I am a developer")
-        result = tc.word_count(max_length=3)
-        assert result.total == 3  # "I", "am", "a"
-
-    def test_unique_only(self):
-        """unique_only counts each word once."""
-        tc = TextCounter("hello world hello")
-        result = tc.word_count(unique_only=True)
-        assert result.total == 2
-
-    def test_case_sensitive(self):
-        """case_sensitive distinguishes case."""
-        tc = TextCounter("Hello hello HELLO")
-        result = tc.word_count(case_sensitive=True, unique_only=True)
-        assert result.total == 3
-
-    def test_case_insensitive(self):
-        """case_sensitive=False normalizes words."""
-        tc = TextCounter("Hello hello HELLO")
-        result = tc.word_count(case_sensitive=False, unique_only=True)
-        assert result.total == 1
-
-    def test_empty_string(self):
-        """Empty string returns zero count."""
-        tc = TextCounter("")
-        assert tc.word_count().total == 0
+    @pytest.mark.parametrize(
+        "text, kwargs, expected",
+        [
+            ("Hello World", {}, 2),
+            ("Hello, World!", {}, 2),
+            ("Hello 123 World", {"ignore_numbers": True}, 2),
+            ("I am a developer", {"min_length": 2}, 2),  # "am" and "developer"
+            ("I am a developer", {"max_length": 3}, 3),  # "I", "am", "a"
+            ("hello world hello", {"unique_only": True}, 2),
+            ("Hello hello HELLO", {"case_sensitive": True, "unique_only": True}, 3),
+            ("Hello hello HELLO", {"case_sensitive": False, "unique_only": True}, 1),
+            ("", {}, 0),
+        ],
+        ids=[
+            "basic",
+            "strips_punctuation_by_default",
+            "ignore_numbers",
+            "min_length",
+            "max_length",
+            "unique_only",
+            "case_sensitive",
+            "case_insensitive",
+            "empty_string",
+        ],
+    )
+    def test_option_totals(self, counter_for, text, kwargs, expected):
+        """Each filtering option yields the expected word total."""
+        assert counter_for(text).word_count(**kwargs).total == expected
 
     def test_breakdown_frequencies(self):
         """Breakdown contains word frequencies."""
@@ -273,64 +330,102 @@ class TestWordCounting:
         assert result.breakdown["hello"] == 2
         assert result.breakdown["world"] == 1
 
+    def test_splits_only_on_ascii_whitespace(self):
+        """Raw tokens split on string.whitespace, ASCII or not."""
+        tc = TextCounter("a\x1cb c\td\xa0e")
+        result = tc.word_count(ignore_punctuation=False)
+        assert result.breakdown == {"a\x1cb": 1, "c": 1, "d\xa0e": 1}
+        assert TextCounter("a b\tc").word_count(ignore_punctuation=False) == 3
 
-class TestLineCounting:
-    """Tests for line_count method."""
-
-    def test_single_line(self):
-        """Single line text."""
-        tc = TextCounter("Hello World")
-        assert tc.line_count().total == 1
+    def test_generated_text_matches_reference(self, rng):
+        """Tokenizing a large generated text agrees with split-and-strip."""
+        text = "".join(rng.choices("aAb.,'- \n\t", k=200_000))
+        tokens = (token.strip(string.punctuation) for token in text.split())
+        expected = Counter(word for word in tokens if word)
+        tc = TextCounter(text)
+        assert tc.word_count().breakdown == expected
+        assert tc.word_count(case_sensitive=False).total == sum(expected.values())
 
-    def test_multiple_lines(self):
-        """Multi-line text."""
-        tc = TextCounter("Hello\nWorld\nTest")
-        assert tc.line_count().total == 3
 
-    def test_ignore_empty_lines(self):
-        """ignore_empty excludes empty lines."""
-        tc = TextCounter("Hello\n\nWorld")
-        result = tc.line_count(ignore_empty=True)
-        assert result.total == 2
+class TestLineCounting:
+    """Tests for line_count method."""
 
-    def test_ignore_whitespace_only(self):
-        """ignore_whitespace_only excludes whitespace-only lines."""
-        tc = TextCounter("Hello\n   \nWorld")
-        result = tc.line_count(ignore_whitespace_only=True)
-        assert result.total == 2
+    @pytest.mark.parametrize(
+        "text, kwargs, expected",
+        [
+            ("Hello World", {}, 1),
+            ("Hello\nWorld\nTest", {}, 3),
+            ("Hello\n\nWorld", {"ignore_empty": True}, 2),
+            ("Hello\n   \nWorld", {"ignore_whitespace_only": True}, 2),
+        ],
+        ids=["single", "multiple", "ignore_empty", "ignore_whitespace_only"],
+    )
+    def test_option_totals(self, counter_for, text, kwargs, expected):
+        """Each filtering option yields the expected line total."""
+        assert counter_for(text).line_count(**kwargs).total == expected
 
 
 class TestSentenceCounting:
     """Tests for sentence_count method."""
 
-    def test_single_sentence(self):
-        """Single sentence."""
-        tc = TextCounter("Hello World.")
-        assert tc.sentence_count().total == 1
-
-    def test_multiple_sentences(self):
-        """Multiple sentences with varied punctuation."""
-        tc = TextCounter("Hello! How are you? I'm fine.")
-        assert tc.sentence_count().total == 3
-
-    def test_no_punctuation(self):
-        """Text without ending punctuation."""
-        tc = TextCounter("Hello World")
-        assert tc.sentence_count().total == 1
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("Hello World.", 1),
+            ("Hello! How are you? I'm fine.", 3),
+            ("Hello World", 1),
+        ],
+        ids=["single", "varied_punctuation", "no_punctuation"],
+    )
+    def test_totals(self, counter_for, text, expected):
+        """Sentences are counted by terminal punctuation."""
+        assert counter_for(text).sentence_count().total == expected
 
 
 class TestParagraphCounting:
     """Tests for paragraph_count method."""
 
-    def test_single_paragraph(self):
-        """Single paragraph."""
-        tc = TextCounter("Hello World")
-        assert tc.paragraph_count().total == 1
-
-    def test_multiple_paragraphs(self):
-        """Multiple paragraphs separated by blank lines."""
-        tc = TextCounter("Para 1\n\nPara 2\n\nPara 3")
-        assert tc.paragraph_count().total == 3
+    @pytest.mark.parametrize(
+        "text, expected",
+        [("Hello World", 1), ("Para 1\n\nPara 2\n\nPara 3", 3)],
+        ids=["single", "blank_line_separated"],
+    )
+    def test_totals(self, counter_for, text, expected):
+        """Paragraphs are separated by blank lines."""
+        assert counter_for(text).paragraph_count().total == expected
+
+
+class TestTotalsOnly:
+    """Tests for compute_breakdown=False."""
+
+    def test_char_totals_match(self):
+        """Character totals match with and without a breakdown."""
+        tc = TextCounter("Hello, World! 123\n")
+        for kwargs in (
+            {},
+            {"ignore_spaces": True, "ignore_punctuation": True},
+            {"ignore_digits": True, "ignore_newlines": True},
+            {"case_sensitive": False, "count_only": "lo"},
+        ):
+            result = tc.char_count(compute_breakdown=False, **kwargs)
+            assert result.total == tc.char_count(**kwargs).total
+            assert result.breakdown == {}
+
+    def test_word_totals_match(self):
+        """Word totals match with and without a breakdown."""
+        tc = TextCounter("The cat and the hat. The end")
+        for kwargs in ({}, {"unique_only": True, "case_sensitive": False}):
+            result = tc.word_count(compute_breakdown=False, **kwargs)
+            assert result.total == tc.word_count(**kwargs).total
+            assert result.breakdown == {}
+
+    def test_structure_totals_match(self):
+        """Line, sentence, and paragraph totals skip the breakdown."""
+        tc = TextCounter("One. Two!\n\nThree?\n")
+        for method in ("line_count", "sentence_count", "paragraph_count"):
+            result = getattr(tc, method)(compute_breakdown=False)
+            assert result.total == getattr(tc, method)().total
+            assert result.breakdown == {}
 
 
 class TestSummary:
@@ -351,8 +446,68 @@ class TestSummary:
         for key in expected:
             assert key in summary
 
-    def test_cached_summary(self):
-        """Cached summary property works."""
+    def test_cached_summary(self, monkeypatch):
+        """Repeated summary access computes the counts only once."""
+        calls = []
+        compute = TextCounter._compute_summary
+
+        def spy(self):
+            calls.append(self)
+            return compute(self)
+
+        monkeypatch.setattr(TextCounter, "_SUMMARIES", {})
+        monkeypatch.setattr(TextCounter, "_compute_summary", spy)
         tc = TextCounter("Hello World!")
         summary = tc.summary
         assert "unique_words" in summary
+        assert tc.summary is summary
+        assert TextCounter("Hello World!").summary == summary
+        assert len(calls) == 1
+
+    def test_summary_shared_between_equal_texts(self):
+        """Counters over equal texts agree without sharing one dict."""
+        first = TextCounter("Shared text here.")
+        second = TextCounter("Shared text here.")
+        first.summary["words"] = 0
+        assert second.summary["words"] == 3
+        assert second.summary is not first.summary
+
+    def test_summary_hash_collision_not_shared(self, monkeypatch):
+        """An entry cached for another text under the same key is ignored."""
+        text = "Some document text."
+        other = (("characters", len(text)), ("words", 99))
+        key = (len(text), hash(text))
+        monkeypatch.setattr(TextCounter, "_SUMMARIES", {key: ("x" * len(text), other)})
+        assert TextCounter(text).summary["words"] == 3
+        assert TextCounter._SUMMARIES[key][1] == other
+
+    def test_summary_long_text_not_shared(self, monkeypatch):
+        """Texts above the size limit are summarized without being cached."""
+        monkeypatch.setattr(TextCounter, "_SUMMARIES", {})
+        monkeypatch.setattr(TextCounter, "_SUMMARY_TEXT_MAX", 4)
+        assert TextCounter("too long").summary["words"] == 2
+        assert TextCounter._SUMMARIES == {}
+
+    def test_summary_matches_count_methods(self):
+        """Summary figures agree with the individual count methods."""
+        tc = TextCounter("Hello, World! Hello again.\n\nNew para here?")
+        summary = tc.summary
+        assert summary["characters"] == tc.char_count().total
+        assert summary["characters_no_spaces"] == (
+            tc.char_count(ignore_spaces=True).total
+        )
+        assert summary["words"] == tc.word_count().total
+        assert summary["unique_words"] == (
+            tc.word_count(unique_only=True, case_sensitive=False).total
+        )
+        assert summary["lines"] == tc.line_count().total
+        assert summary["sentences"] == tc.sentence_count().total
+        assert summary["paragraphs"] == tc.paragraph_count().total
+
+    def test_get_summary_omits_unique_words(self):
+        """get_summary returns the summary without unique_words."""
+        tc = TextCounter("Hello World!")
+        summary = tc.get_summary()
+        assert "unique_words" not in summary
+        summary["words"] = 0
+        assert tc.get_summary()["words"] == 2